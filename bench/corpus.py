@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Deterministic URL corpora for the benchmarks."""
+
+import random
+
+
+def short_urls(count=200, seed=0):
+    """Typical short URLs: a host, a couple of path segments, a small query."""
+    rng = random.Random(seed)
+    schemes = ['http', 'https']
+    words = ['api', 'v2', 'users', 'search', 'static', 'img', 'index.html']
+    urls = []
+    for i in range(count):
+        netloc = 'www.example%d.com' % rng.randrange(50)
+        if rng.random() < 0.2:
+            netloc = 'user:secret@' + netloc
+        if rng.random() < 0.2:
+            netloc += ':%d' % rng.choice([80, 443, 8080])
+        path = '/' + '/'.join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+        query = 'id=%d&page=%d' % (i, rng.randrange(10))
+        fragment = '#top' if rng.random() < 0.3 else ''
+        urls.append('%s://%s%s?%s%s' % (rng.choice(schemes), netloc, path,
+                                         query, fragment))
+    return urls
+
+
+def long_query_urls(count=20, params=100, seed=1):
+    """URLs with ``params`` query parameters, some encoded and repeated."""
+    rng = random.Random(seed)
+    urls = []
+    for i in range(count):
+        pairs = []
+        for j in range(params):
+            name = rng.choice(['utm_source', 'utm_medium', 'id', 'page',
+                               'q', 'session', 'ref', 'p%d' % j])
+            value = rng.choice(['abc', '123', 'hello+world', 'a%2Fb', '',
+                                'caf%C3%A9', str(j)])
+            pairs.append(name + '=' + value)
+        urls.append('https://tracker.example.com/click?' + '&'.join(pairs))
+    return urls
+
+
+def deep_path_urls(count=50, depth=30, seed=2):
+    """URLs with ``depth`` path segments, a few of them percent-encoded."""
+    rng = random.Random(seed)
+    segments = ['a', 'b', 'api', 'v2', 'users', 'with%20space', 'caf%C3%A9',
+                '12345']
+    urls = []
+    for i in range(count):
+        path = '/'.join(rng.choice(segments) for _ in range(depth))
+        trailing = '/' if rng.random() < 0.5 else ''
+        urls.append('http://example.com/' + path + trailing)
+    return urls
+
+
+def idn_iris(count=100, seed=3):
+    """IRIs with non-ASCII hosts, paths, queries and fragments."""
+    rng = random.Random(seed)
+    hosts = [u'\xe9xample.com', u'b\xfccher.de', u'\u4f8b\u3048.jp',
+             u'\u043f\u0440\u0438\u043c\u0435\u0440.\u0440\u0444']
+    paths = [u'/p\xe5th', u'/caf\xe9/men\xfc', u'/\u6587\u5b57/a b']
+    iris = []
+    for i in range(count):
+        iris.append(u'https://%s%s?k\xe9y=v\xe5l%d#fr\xe5g' % (
+            rng.choice(hosts), rng.choice(paths), i))
+    return iris
+
+
+def relative_hrefs(count=200, seed=4):
+    """Link targets of the shapes found in HTML pages."""
+    rng = random.Random(seed)
+    shapes = ['http://other.example.org/x/y', '//cdn.example.net/lib.js',
+              '/about/team', '../up/one', 'sibling.html', './here?x=1',
+              '?page=2', '#section-3', '', 'a/b/c/../d']
+    return [rng.choice(shapes) for _ in range(count)]
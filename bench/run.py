@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the URLObject hot paths.
+
+Run every benchmark (or those whose names contain ``-k`` substrings) and
+print the time per URL; ``-o`` also saves the results as JSON::
+
+    python bench/run.py -o before.json
+    python bench/run.py -k query -k path
+
+Compare two saved runs, e.g. from different releases; the exit status is 1
+if anything got slower than ``--threshold`` allows::
+
+    python bench/run.py --compare before.json after.json
+
+Everything runs offline with the standard library. Benchmarks for APIs the
+installed version doesn't have are reported as unavailable and skipped.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus  # noqa: E402
+from urlobject import URLObject  # noqa: E402
+from urlobject.netloc import Netloc  # noqa: E402
+from urlobject.path import URLPath  # noqa: E402
+from urlobject.query_string import QueryString  # noqa: E402
+
+
+CORPORA = {
+    'short': corpus.short_urls(),
+    'auth': [url.replace('://', '://user:secret@', 1) if '@' not in url else url
+             for url in corpus.short_urls()],
+    'long_query': corpus.long_query_urls(),
+    'deep_path': corpus.deep_path_urls(),
+    'idn': corpus.idn_iris(),
+}
+
+#: (name, corpus name, factory) in run order. A factory takes the corpus and
+#: returns a function which processes every item in it once.
+BENCHMARKS = []
+
+
+def benchmark(name, corpus_name):
+    def register(factory):
+        BENCHMARKS.append((name, corpus_name, factory))
+        return factory
+    return register
+
+
+@benchmark('URLObject()', 'short')
+def bench_construct(urls):
+    return lambda: [URLObject(url) for url in urls]
+
+
+@benchmark('URLObject.from_iri', 'idn')
+def bench_from_iri(iris):
+    return lambda: [URLObject.from_iri(iri) for iri in iris]
+
+
+PROPERTIES = ['scheme', 'netloc', 'username', 'password', 'hostname', 'port',
+              'default_port', 'auth', 'path', 'query', 'fragment',
+              'query_list', 'query_dict', 'query_multi_dict', 'is_leaf',
+              'root', 'parent']
+
+
+def property_benchmarks():
+    for prop in PROPERTIES:
+        # "cold" includes parsing a new URL; "warm" reuses parsed URLs.
+        def cold(urls, prop=prop):
+            getattr(URLObject, prop)
+            return lambda: [getattr(URLObject(url), prop) for url in urls]
+
+        def warm(urls, prop=prop):
+            objects = [URLObject(url) for url in urls]
+            for url in objects:
+                getattr(url, prop)
+            return lambda: [getattr(url, prop) for url in objects]
+        benchmark('URLObject.%s (cold)' % prop, 'short')(cold)
+        benchmark('URLObject.%s (warm)' % prop, 'short')(warm)
+
+property_benchmarks()
+
+
+METHODS = [
+    ('with_scheme', ('ftp',), 'short'),
+    ('with_netloc', ('example.org',), 'short'),
+    ('with_username', ('bob',), 'short'),
+    ('without_username', (), 'auth'),
+    ('with_password', ('hunter2',), 'auth'),
+    ('without_password', (), 'auth'),
+    ('with_hostname', ('example.org',), 'short'),
+    ('with_port', (8443,), 'short'),
+    ('without_port', (), 'short'),
+    ('with_auth', ('bob', 'hunter2'), 'short'),
+    ('without_auth', (), 'auth'),
+    ('with_path', ('/a/b/c',), 'short'),
+    ('add_path_segment', ('d e',), 'short'),
+    ('add_path_segments', (['d e', 'f', 'g/h'],), 'short'),
+    ('add_path', ('d/e/f',), 'short'),
+    ('with_query', ('a=b',), 'short'),
+    ('without_query', (), 'short'),
+    ('add_query_param', ('utm_source', 'news'), 'short'),
+    ('add_query_params', ([('a', '1'), ('b', '2'), ('c', '3')],), 'short'),
+    ('set_query_param', ('page', '3'), 'short'),
+    ('set_query_params', ([('page', '3'), ('sort', 'asc')],), 'short'),
+    ('del_query_param', ('page',), 'short'),
+    ('del_query_params', (['id', 'page'],), 'short'),
+    ('del_query_param_value', ('page', '1'), 'short'),
+    ('with_fragment', ('section 2',), 'short'),
+    ('without_fragment', (), 'short'),
+    ('relative', ('../x/y?z=1',), 'short'),
+    ('set_query_params', ([('p%d' % i, 'x') for i in range(20)],), 'long_query'),
+    ('del_query_params', (['utm_source', 'utm_medium', 'ref'],), 'long_query'),
+]
+
+
+def method_benchmarks():
+    for method, args, corpus_name in METHODS:
+        def factory(urls, method=method, args=args):
+            objects = [URLObject(url) for url in urls]
+            getattr(URLObject, method)
+            return lambda: [getattr(url, method)(*args) for url in objects]
+        benchmark('URLObject.%s [%s]' % (method, corpus_name), corpus_name)(factory)
+
+method_benchmarks()
+
+
+@benchmark('URLObject.relative (link shapes)', 'short')
+def bench_relative_shapes(urls):
+    base = URLObject(urls[0])
+    hrefs = corpus.relative_hrefs(len(urls))
+    return lambda: [base.relative(href) for href in hrefs]
+
+
+@benchmark('URLObject.resolve_many (link shapes)', 'short')
+def bench_resolve_many(urls):
+    base = URLObject(urls[0])
+    hrefs = corpus.relative_hrefs(len(urls))
+    return lambda: base.resolve_many(hrefs)
+
+
+@benchmark('BaseURL.resolve (link shapes)', 'short')
+def bench_base_url_resolve(urls):
+    from urlobject.resolution import BaseURL
+    base = BaseURL(urls[0])
+    hrefs = corpus.relative_hrefs(len(urls))
+    return lambda: [base.resolve(href) for href in hrefs]
+
+
+NETLOC_PROPERTIES = ['username', 'password', 'hostname', 'port']
+
+NETLOC_METHODS = [
+    ('with_username', ('bob',)),
+    ('without_username', ()),
+    ('with_password', ('hunter2',)),
+    ('without_password', ()),
+    ('with_auth', ('bob', 'hunter2')),
+    ('without_auth', ()),
+    ('with_hostname', ('example.org',)),
+    ('with_port', (8443,)),
+    ('without_port', ()),
+]
+
+
+def netloc_benchmarks():
+    for prop in NETLOC_PROPERTIES:
+        def factory(urls, prop=prop):
+            netlocs = [URLObject(url).netloc for url in urls]
+            return lambda: [getattr(Netloc(netloc), prop) for netloc in netlocs]
+        benchmark('Netloc.%s' % prop, 'auth')(factory)
+    for method, args in NETLOC_METHODS:
+        def factory(urls, method=method, args=args):
+            netlocs = [URLObject(url).netloc for url in urls]
+            getattr(Netloc, method)
+            return lambda: [getattr(netloc, method)(*args) for netloc in netlocs]
+        benchmark('Netloc.%s' % method, 'auth')(factory)
+
+netloc_benchmarks()
+
+
+@benchmark('QueryString.list', 'long_query')
+def bench_qs_list(urls):
+    queries = [URLObject(url).query for url in urls]
+    return lambda: [QueryString(query).list for query in queries]
+
+
+@benchmark('QueryString.dict', 'long_query')
+def bench_qs_dict(urls):
+    queries = [URLObject(url).query for url in urls]
+    return lambda: [QueryString(query).dict for query in queries]
+
+
+@benchmark('QueryString.multi_dict', 'long_query')
+def bench_qs_multi_dict(urls):
+    queries = [URLObject(url).query for url in urls]
+    return lambda: [QueryString(query).multi_dict for query in queries]
+
+
+@benchmark('QueryString.add_params (20 params)', 'long_query')
+def bench_qs_add_params(urls):
+    queries = [URLObject(url).query for url in urls]
+    params = [('n%d' % i, 'value %d' % i) for i in range(20)]
+    return lambda: [query.add_params(params) for query in queries]
+
+
+@benchmark('QueryString.set_params (20 params)', 'long_query')
+def bench_qs_set_params(urls):
+    queries = [URLObject(url).query for url in urls]
+    params = [('p%d' % i, 'value') for i in range(0, 100, 5)]
+    return lambda: [query.set_params(params) for query in queries]
+
+
+@benchmark('QueryString.del_params', 'long_query')
+def bench_qs_del_params(urls):
+    queries = [URLObject(url).query for url in urls]
+    return lambda: [query.del_params(['utm_source', 'session', 'p50'])
+                    for query in queries]
+
+
+@benchmark('URLPath.segments', 'deep_path')
+def bench_path_segments(urls):
+    paths = [URLObject(url).path for url in urls]
+    return lambda: [URLPath(path).segments for path in paths]
+
+
+@benchmark('URLPath.add_segment', 'deep_path')
+def bench_path_add_segment(urls):
+    paths = [URLObject(url).path for url in urls]
+    return lambda: [path.add_segment('new segment') for path in paths]
+
+
+@benchmark('URLPath.relative', 'deep_path')
+def bench_path_relative(urls):
+    paths = [URLObject(url).path for url in urls]
+    return lambda: [path.relative('../../x/./y') for path in paths]
+
+
+@benchmark('URLPath.join_segments', 'deep_path')
+def bench_path_join_segments(urls):
+    segments = [URLObject(url).path.segments for url in urls]
+    return lambda: [URLPath.join_segments(segs) for segs in segments]
+
+
+def run(patterns=(), repeat=5, min_time=0.2, out=sys.stdout):
+    results = {}
+    for name, corpus_name, factory in BENCHMARKS:
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        items = CORPORA[corpus_name]
+        try:
+            func = factory(items)
+        except (AttributeError, ImportError):
+            out.write('%-55s unavailable\n' % name)
+            continue
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        best = min(timer.repeat(repeat=repeat, number=number))
+        ns_per_item = best / number / len(items) * 1e9
+        results[name] = {'ns_per_item': ns_per_item, 'items': len(items),
+                         'number': number, 'repeat': repeat}
+        out.write('%-55s %12.0f ns/item\n' % (name, ns_per_item))
+    return results
+
+
+def compare(old_path, new_path, threshold, out=sys.stdout):
+    with open(old_path) as fileobj:
+        old = json.load(fileobj)['benchmarks']
+    with open(new_path) as fileobj:
+        new = json.load(fileobj)['benchmarks']
+    regressions = 0
+    for name in sorted(set(old) & set(new)):
+        ratio = new[name]['ns_per_item'] / old[name]['ns_per_item']
+        flag = ''
+        if ratio > threshold:
+            flag = '  SLOWER'
+            regressions += 1
+        elif ratio < 1 / threshold:
+            flag = '  faster'
+        out.write('%-55s %10.0f %10.0f %7.2fx%s\n' % (
+            name, old[name]['ns_per_item'], new[name]['ns_per_item'], ratio, flag))
+    for name in sorted(set(old) ^ set(new)):
+        out.write('%-55s only in %s\n' % (name, old_path if name in old else new_path))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help='only run benchmarks whose names contain this')
+    parser.add_argument('-o', '--output', help='write results to this JSON file')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='seconds to spend on each timing run')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two JSON result files')
+    parser.add_argument('--threshold', type=float, default=1.1,
+                        help='slowdown ratio counted as a regression')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare(args.compare[0], args.compare[1], args.threshold) else 0
+
+    results = run(args.patterns, args.repeat, args.min_time)
+    if args.output:
+        meta = {'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        with open(args.output, 'w') as fileobj:
+            json.dump({'meta': meta, 'benchmarks': results}, fileobj, indent=2,
+                      sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
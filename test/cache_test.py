@@ -0,0 +1,95 @@
+import doctest
+import unittest
+
+from pytest import raises
+
+from urlobject import cache as cache_module
+from urlobject import path as path_module
+from urlobject import query_string as query_string_module
+from urlobject.cache import codec_cache
+from urlobject.path import URLPath, path_decode, path_encode
+from urlobject.query_string import QueryString, qs_decode
+
+
+class CodecCacheTest(unittest.TestCase):
+
+    def tearDown(self):
+        codec_cache.disable()
+
+    def test_codec_cache_is_disabled_by_default(self):
+        assert not codec_cache.is_enabled
+        assert codec_cache.info() == {}
+
+    def test_cached_functions_give_the_same_results(self):
+        path = URLPath('/api/v2/caf%C3%A9/')
+        query = QueryString('utm_source=a+b&id=%7E')
+        expected = (path.segments, query.list, path_encode('a b/c', safe='/'))
+        codec_cache.enable()
+        for _ in range(3):
+            assert (path.segments, query.list,
+                    path_encode('a b/c', safe='/')) == expected
+
+    def test_info_counts_hits_and_misses(self):
+        codec_cache.enable()
+        qs_decode('a+b')
+        qs_decode('a+b')
+        info = codec_cache.info()['qs_decode']
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_cache_is_bounded_by_maxsize(self):
+        codec_cache.enable(maxsize=2)
+        for segment in ['a', 'b', 'c', 'd']:
+            path_decode(segment)
+        assert codec_cache.info()['path_decode'].currsize == 2
+
+    def test_clear_empties_the_cache_but_leaves_it_enabled(self):
+        codec_cache.enable()
+        path_decode('a')
+        codec_cache.clear()
+        assert codec_cache.is_enabled
+        assert codec_cache.info()['path_decode'].currsize == 0
+
+    def test_only_the_private_binding_is_swapped(self):
+        public = path_module.path_decode
+        assert path_module._path_decode is path_module._path_decode_py3
+        codec_cache.enable()
+        assert path_module._path_decode.__wrapped__ is path_module._path_decode_py3
+        assert path_module.path_decode is public
+        codec_cache.disable()
+        assert path_module._path_decode is path_module._path_decode_py3
+
+    def test_functions_imported_elsewhere_are_cached_too(self):
+        from urlobject import urlobject as urlobject_module
+        codec_cache.enable()
+        urlobject_module.path_decode('a')
+        path_decode('a')
+        assert codec_cache.info()['path_decode'].hits == 1
+
+    def test_unhashable_arguments_bypass_the_cache(self):
+        expected = path_encode(bytearray(b'a b'), safe='/')
+        with codec_cache.caching():
+            assert path_encode(bytearray(b'a b'), safe='/') == expected
+            assert codec_cache.info()['path_encode'].currsize == 0
+            # Errors from the functions themselves still come through.
+            raises(TypeError, lambda: path_encode(1.5))
+
+    def test_caching_context_manager_restores_the_previous_state(self):
+        with codec_cache.caching(maxsize=10):
+            assert codec_cache.is_enabled
+            assert codec_cache.info()['qs_encode'].maxsize == 10
+        assert not codec_cache.is_enabled
+
+        codec_cache.enable()
+        path_decode('a')
+        with codec_cache.caching():
+            path_decode('a')
+        assert codec_cache.is_enabled
+        assert codec_cache.info()['path_decode'].hits == 1
+
+
+class CacheDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(cache_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
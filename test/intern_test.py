@@ -0,0 +1,60 @@
+import doctest
+import unittest
+
+from urlobject import intern as intern_module
+from urlobject import URLObject
+from urlobject.intern import Pool, PoolInfo
+from urlobject.netloc import Netloc
+
+
+class PoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = Pool()
+
+    def test_url_returns_the_same_instance_for_equal_urls(self):
+        first = self.pool.url('https://github.com/zacharyvoase/urlobject')
+        second = self.pool.url(''.join(['https://github.com/', 'zacharyvoase/urlobject']))
+        assert first is second
+        assert type(first) is URLObject
+
+    def test_url_pools_url_class_instances_without_copying(self):
+        url = URLObject('https://github.com/')
+        assert self.pool.url(url) is url
+        assert self.pool.url('https://github.com/') is url
+
+    def test_netloc_returns_shared_Netloc_instances(self):
+        netloc = self.pool.netloc('user@github.com:8080')
+        assert type(netloc) is Netloc
+        assert self.pool.netloc(URLObject('http://user@github.com:8080/').netloc) is netloc
+
+    def test_hostname_and_scheme_return_shared_plain_strings(self):
+        url1 = URLObject('https://github.com/a')
+        url2 = URLObject('https://github.com/b')
+        assert self.pool.hostname(url1.hostname) is self.pool.hostname(url2.hostname)
+        assert self.pool.scheme(url1.scheme) is self.pool.scheme(url2.scheme)
+        assert type(self.pool.scheme(url1.scheme)) is str
+        assert self.pool.hostname(None) is None
+
+    def test_info_counts_hits_misses_and_size(self):
+        for url in ['http://a/', 'http://b/', 'http://a/']:
+            self.pool.url(url)
+        info = self.pool.info()
+        assert info['url'] == PoolInfo(hits=1, misses=2, size=2)
+        assert info['netloc'] == PoolInfo(hits=0, misses=0, size=0)
+        assert len(self.pool) == 2
+
+    def test_clear_empties_the_pool(self):
+        first = self.pool.url('http://a/')
+        self.pool.clear()
+        assert len(self.pool) == 0
+        assert self.pool.url('http://' + 'a/') is not first
+        assert self.pool.info()['url'] == PoolInfo(hits=0, misses=1, size=1)
+
+
+class InternDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(intern_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
@@ -1,7 +1,9 @@
+import pickle
 import unittest
 
 from pytest import raises
 
+from urlobject.compat import urlparse
 from urlobject.netloc import Netloc
 
 
@@ -108,3 +110,55 @@ class NetlocTest(unittest.TestCase):
 
     def test_without_port_removes_port(self):
         assert Netloc('github.com:443').without_port() == 'github.com'
+
+    def test_replace_changes_several_components_at_once(self):
+        netloc = Netloc('zack:1234@github.com:443')
+        assert netloc.replace(username='jim', port=8080) == 'jim:1234@github.com:8080'
+        assert netloc.replace(username=None, password=None) == 'github.com:443'
+        assert netloc.replace() == netloc
+        assert type(netloc.replace(port=None)) is Netloc
+
+    def test_replace_can_fix_an_invalid_port(self):
+        assert Netloc('github.com:x').replace(port=80) == 'github.com:80'
+
+    def test_replace_rejects_unknown_components(self):
+        raises(TypeError, lambda: Netloc('github.com').replace(scheme='http'))
+
+    def test_replace_rejects_a_password_without_a_username(self):
+        raises(ValueError, lambda: Netloc('github.com').replace(password='1234'))
+        raises(ValueError, lambda: Netloc('zack@github.com').replace(username=None, password='1234'))
+
+    def test_components_are_parsed_once_and_cached(self):
+        netloc = Netloc('zack:1234@github.com:443')
+        assert (netloc.username, netloc.password, netloc.hostname, netloc.port) == (
+            'zack', '1234', 'github.com', 443)
+        assert set(netloc.__dict__) == set(['__components', 'username', 'password', 'hostname', 'port'])
+        assert netloc.hostname is netloc.hostname
+
+    def test_components_match_urlsplit(self):
+        for string in ['', 'github.com', 'Zack:1:2@GitHub.com:443', 'a@b@c',
+                       ':80', '@', '[::1]', 'u@[FE80::1%25Eth0]:8', '[::1:80']:
+            netloc = Netloc(string)
+            split = urlparse.SplitResult('', string, '', '', '')
+            assert (netloc.username, netloc.password, netloc.hostname, netloc.port) == (
+                split.username, split.password, split.hostname, split.port), string
+
+    def test_replace_keeps_ipv6_addresses_in_brackets(self):
+        netloc = Netloc('zack:1234@[::1]:80')
+        assert netloc.without_auth() == '[::1]:80'
+        assert netloc.with_auth('jim', 'pw') == 'jim:pw@[::1]:80'
+        assert netloc.without_port() == 'zack:1234@[::1]'
+        assert netloc.with_hostname('::2') == 'zack:1234@[::2]:80'
+        assert netloc.with_hostname('[::3]') == 'zack:1234@[::3]:80'
+
+    def test_invalid_ports_raise_every_time(self):
+        netloc = Netloc('github.com:x')
+        raises(ValueError, lambda: netloc.port)
+        raises(ValueError, lambda: netloc.port)
+
+    def test_pickling_round_trips_without_the_component_cache(self):
+        netloc = Netloc('zack:1234@github.com:443')
+        netloc.hostname
+        copy = pickle.loads(pickle.dumps(netloc))
+        assert copy == netloc and type(copy) is Netloc
+        assert copy.__dict__ == {}
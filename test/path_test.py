@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import pickle
 import unittest
 
-from urlobject.path import URLPath
+from urlobject.path import URLPath, remove_dot_segments
 from urlobject.six import u
 
 
@@ -55,6 +56,44 @@ class URLPathTest(unittest.TestCase):
     def test_parent_of_a_non_leaf_node(self):
         assert URLPath('/a/b/c/').parent == '/a/b/'
 
+    def test_parent_of_the_root_is_the_root(self):
+        assert URLPath('/').parent == '/'
+        assert URLPath('/a').parent == '/'
+
+    def test_parent_matches_urljoin_for_unusual_paths(self):
+        assert URLPath('/a/./b').parent == '/a/'
+        assert URLPath('/a//b/').parent == '/a/'
+        assert URLPath('a/b').parent == 'a/'
+
+    def test_is_leaf_and_is_relative_handle_the_empty_path(self):
+        assert not URLPath('').is_leaf
+        assert URLPath('').is_relative
+        assert not URLPath('').is_absolute
+
+    def test_depth_counts_segments_without_a_trailing_slash(self):
+        assert URLPath('').depth == 0
+        assert URLPath('/').depth == 0
+        assert URLPath('/a').depth == 1
+        assert URLPath('/a/b/').depth == 2
+        assert URLPath('a/b/c').depth == 3
+        assert URLPath('/a//b').depth == 3
+
+    def test_raw_segments_are_not_decoded(self):
+        assert URLPath('/a%20b/c/').raw_segments == ('a%20b', 'c', '')
+        assert URLPath('a/b').raw_segments == ('a', 'b')
+
+    def test_segments_are_cached(self):
+        path = URLPath('/a%20b/c')
+        assert path.segments is path.segments
+        assert path.parent is path.parent
+
+    def test_pickling_round_trips_without_the_segment_cache(self):
+        path = URLPath('/a%20b/c')
+        path.segments
+        copy = pickle.loads(pickle.dumps(path))
+        assert copy == path and type(copy) is URLPath
+        assert copy.__dict__ == {}
+
     def test_relative_on_a_leaf_node(self):
         path = URLPath('/a/b/c')
         assert path.relative('.') == '/a/b/'
@@ -85,6 +124,23 @@ class URLPathTest(unittest.TestCase):
     def test_add_segment_encodes_slash_characters(self):
         assert URLPath('/a/b/c').add_segment('d/e') == '/a/b/c/d%2Fe'
 
+    def test_add_segments_adds_each_segment_in_turn(self):
+        assert URLPath('').add_segments(['a', 'b']) == 'a/b'
+        assert URLPath('/').add_segments(['a', 'b']) == '/a/b'
+        assert URLPath('/a/b/c').add_segments(['d', 'e/']) == '/a/b/c/d/e%2F'
+        assert URLPath('/a/b/c').add_segments([]) == '/a/b/c'
+
+    def test_add_segments_handles_empty_segments_like_add_segment(self):
+        for base in ('', '/', 'a', '/a', '/a/'):
+            for segments in (['', 'b'], ['b', ''], ['', ''], ['b', '', 'c']):
+                expected = URLPath(base)
+                for segment in segments:
+                    expected = expected.add_segment(segment)
+                assert URLPath(base).add_segments(segments) == expected
+
+    def test_add_segments_accepts_any_iterable(self):
+        assert URLPath('/a').add_segments(iter(['b', 'c'])) == '/a/b/c'
+
     def test_add_concatenates_whole_paths(self):
         assert URLPath('').add('a') == 'a'
         assert URLPath('/').add('a') == '/a'
@@ -97,3 +153,23 @@ class URLPathTest(unittest.TestCase):
 
     def test_add_does_not_encode_slash_characters(self):
         assert URLPath('/a/b/c').add('d/e') == '/a/b/c/d/e'
+
+
+class RemoveDotSegmentsTest(unittest.TestCase):
+
+    def test_rfc_3986_examples(self):
+        assert remove_dot_segments('/a/b/c/./../../g') == '/a/g'
+        assert remove_dot_segments('mid/content=5/../6') == 'mid/6'
+
+    def test_cannot_go_above_the_root(self):
+        assert remove_dot_segments('/../a') == '/a'
+        assert remove_dot_segments('/a/../..') == '/'
+        assert remove_dot_segments('../a') == 'a'
+
+    def test_trailing_dot_segments_leave_a_trailing_slash(self):
+        assert remove_dot_segments('/a/b/.') == '/a/b/'
+        assert remove_dot_segments('/a/b/..') == '/a/'
+
+    def test_leaves_other_dots_alone(self):
+        assert remove_dot_segments('/a/.b/c./..d/file.txt') == '/a/.b/c./..d/file.txt'
+        assert remove_dot_segments('/a/b') == '/a/b'
@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from copy import deepcopy
+import doctest
+import pickle
 import unittest
 
-from urlobject.query_string import QueryString
+from pytest import raises
+
+from urlobject import query_string as query_string_module
+from urlobject.query_string import QueryString, QueryTokenizer
 from urlobject.six import u
 
 
@@ -154,6 +160,14 @@ class QueryStringTest(unittest.TestCase):
         assert (s.set_params([('abc', '123'), ('def', '456')]) ==
                 s.set_param('abc', '123').set_param('def', '456'))
 
+    def test_set_params_matches_set_param_on_existing_and_repeated_names(self):
+        s = QueryString('abc=1&def=2;abc=3&ghi=4')
+        params = [('abc', '5'), ('xyz', ['6', '7']), ('def', None), ('xyz', '8')]
+        expected = s
+        for name, value in params:
+            expected = expected.set_param(name, value)
+        assert s.set_params(params) == expected == 'ghi=4&abc=5&def&xyz=8'
+
     def test_set_params_accepts_the_same_args_as_dict(self):
         s = QueryString('')
         added = s.set_params({'abc': '123'}, abc='456')
@@ -174,6 +188,11 @@ class QueryStringTest(unittest.TestCase):
         assert (s2.set_params({'foo': ['spam', 'ham']}) ==
                 'foo=spam&foo=ham')
 
+    def test_add_params_with_an_empty_list_of_values_matches_add_param(self):
+        s = QueryString('')
+        assert (s.add_params([('abc', []), ('def', '1'), ('ghi', [])]) ==
+                s.add_param('abc', []).add_param('def', '1').add_param('ghi', []))
+
     def test_del_params_accepts_an_iterable_and_removes_all_listed_parameters(self):
         s = QueryString('abc=123&def=456&xyz=789')
         assert s.del_params(('abc', 'xyz')) == 'def=456'
@@ -181,3 +200,139 @@ class QueryStringTest(unittest.TestCase):
     def test_del_param_value_removes_the_specified_value_only(self):
         s = QueryString('abc=123&abc=456&def=789')
         assert s.del_param_value('abc', '456') == 'abc=123&def=789'
+
+    def test_get_param_matches_dict_including_last_wins(self):
+        for query in ['a=1&b=2&a=3', 'a=1;b=x+y;a=%33', 'ab=1&a', 'b=1&a=',
+                      'a%20b=1&a+b=2', '=1&c=2', 'ba=1&aa=2&a=3&a',
+                      'a+b=1', 'c+%2B=1&c%2B=2', 'a%2Bb=1&a+b=2', '%25=1']:
+            s = QueryString(query)
+            for name in ['a', 'b', 'a b', '', 'ba', 'z', 'a+b', 'c+%2B',
+                         'c +', 'c+', 'a%2Bb', '%25', '%']:
+                assert s.get_param(name, 'missing') == s.dict.get(name, 'missing')
+
+    def test_get_param_returns_none_for_valueless_parameters(self):
+        assert QueryString('abc=123&def').get_param('def', 'x') is None
+
+    def test_get_param_returns_the_default_for_missing_names(self):
+        assert QueryString('').get_param('abc') is None
+        assert QueryString('abcd=1&ab=2').get_param('abc', 'x') == 'x'
+
+    def test_del_param_can_preserve_the_encoding_of_other_parameters(self):
+        s = QueryString('a=x%20y;b=1&c=%7E+&b=2')
+        assert s.del_param('b', preserve_encoding=True) == 'a=x%20y&c=%7E+'
+        assert s.del_param('a', preserve_encoding=True) == 'b=1&c=%7E+&b=2'
+        assert s.del_param('z', preserve_encoding=True) == s
+
+    def test_del_param_with_preserve_encoding_matches_encoded_names(self):
+        s = QueryString('a%20b=1&a+b=2&c=3')
+        assert s.del_param('a b', preserve_encoding=True) == 'c=3'
+
+    def test_del_params_can_preserve_the_encoding_of_other_parameters(self):
+        s = QueryString('a=%7E;b=1;c=2;d')
+        assert s.del_params(['b', 'd'], preserve_encoding=True) == 'a=%7E;c=2'
+
+    def test_del_param_value_can_preserve_the_encoding_of_other_parameters(self):
+        s = QueryString('a=%7E;b=x+y;b=x%2Bz;b')
+        assert (s.del_param_value('b', 'x y', preserve_encoding=True) ==
+                'a=%7E;b=x%2Bz;b')
+        assert (s.del_param_value('b', None, preserve_encoding=True) ==
+                'a=%7E;b=x+y;b=x%2Bz')
+
+    def test_set_param_can_preserve_the_encoding_of_other_parameters(self):
+        s = QueryString('a=%7E;b=1')
+        assert s.set_param('b', 'x y', preserve_encoding=True) == 'a=%7E&b=x+y'
+        assert QueryString('').set_param('b', '1', preserve_encoding=True) == 'b=1'
+
+
+class QueryTokenizerTest(unittest.TestCase):
+
+    def test_tokenize_only_splits_on_the_given_separators(self):
+        assert QueryTokenizer('&').tokenize('a=1;b=2&c') == [('a', '1;b=2'), ('c', None)]
+        assert QueryTokenizer(';').tokenize('a=1;b=2&c') == [('a', '1'), ('b', '2&c')]
+        assert QueryTokenizer('&|').tokenize('a=1|b=2&c') == [('a', '1'), ('b', '2'), ('c', None)]
+
+    def test_tokenize_decodes_names_and_values(self):
+        assert QueryTokenizer().tokenize('a+b=c%20d&%7E=') == [('a b', 'c d'), ('~', '')]
+
+    def test_tokenize_returns_an_empty_list_for_empty_queries(self):
+        assert QueryTokenizer().tokenize('') == []
+
+    def test_raw_params_keep_the_separators_and_the_raw_values(self):
+        assert list(QueryTokenizer().raw_params('a+b=c%20d;e&=&f=')) == [
+            ('', 'a+b=c%20d', 'a b', 'c%20d'), (';', 'e', 'e', None),
+            ('&', '=', '', ''), ('&', 'f=', 'f', '')]
+        assert list(QueryTokenizer().raw_params('')) == []
+
+    def test_tokenizer_needs_a_separator(self):
+        raises(ValueError, lambda: QueryTokenizer(''))
+
+    def test_QueryString_subclasses_can_use_another_tokenizer(self):
+        class AmpersandQueryString(QueryString):
+            tokenizer = QueryTokenizer('&')
+        s = AmpersandQueryString('a=1;b=2&c=3&a=4;5')
+        assert s.list == [('a', '1;b=2'), ('c', '3'), ('a', '4;5')]
+        assert s.params.getall('a') == ['1;b=2', '4;5']
+        assert s.get_param('a') == '4;5'
+        assert s.get_param('b') is None
+        assert s.del_param('c', preserve_encoding=True) == 'a=1;b=2&a=4;5'
+
+
+class QueryParamsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.query = QueryString('a=1&b=x+y&a=%32;c&d=&e%20f=g')
+
+    def test_get_returns_the_last_value_like_dict(self):
+        params = self.query.params
+        for name, value in self.query.dict.items():
+            assert params.get(name) == value
+            assert params[name] == value
+
+    def test_get_returns_the_default_for_missing_names(self):
+        assert self.query.params.get('z') is None
+        assert self.query.params.get('z', 'default') == 'default'
+
+    def test_getitem_raises_KeyError_for_missing_names(self):
+        raises(KeyError, lambda: self.query.params['z'])
+
+    def test_getall_matches_multi_dict(self):
+        params = self.query.params
+        for name, values in self.query.multi_dict.items():
+            assert params.getall(name) == values
+        assert params.getall('z') == []
+
+    def test_contains_and_count(self):
+        params = self.query.params
+        assert 'a' in params and 'e f' in params and 'c' in params
+        assert 'e%20f' not in params
+        assert params.count('a') == 2
+        assert params.count('z') == 0
+
+    def test_iterates_over_distinct_names_in_order(self):
+        assert list(self.query.params) == ['a', 'b', 'c', 'd', 'e f']
+        assert len(self.query.params) == 5
+
+    def test_list_matches_QueryString_list(self):
+        assert self.query.params.list() == self.query.list
+        assert QueryString('').params.list() == []
+
+    def test_params_is_cached(self):
+        assert self.query.params is self.query.params
+
+    def test_pickling_and_copying_round_trip_without_the_cached_params(self):
+        self.query.params
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(self.query, protocol))
+            assert copy == self.query and type(copy) is QueryString
+            assert copy.__dict__ == {}
+        copy = deepcopy(self.query)
+        assert copy == self.query and copy.__dict__ == {}
+        assert copy.params.list() == self.query.params.list()
+
+
+class QueryStringDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(query_string_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
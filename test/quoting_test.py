@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import doctest
+import unittest
+
+from urlobject import quoting as quoting_module
+from urlobject.compat import urlparse
+from urlobject.quoting import Quoter, get_quoter
+from urlobject.six import u
+
+
+class QuoterTest(unittest.TestCase):
+
+    samples = ['', 'abc123', 'utm_source', 'a b', 'a/b;c=d&e%20',
+               '~._-', u('caf\xe9'), '\x00\x7f', u('☃ x')]
+
+    def test_quoter_matches_urllib_quote(self):
+        for safe in ['', '/', '/%;', '=&%', '%', ':@']:
+            quote = Quoter(safe)
+            for text in self.samples:
+                assert quote(text) == urlparse.quote(text, safe=safe)
+
+    def test_quoter_with_plus_matches_urllib_quote_plus(self):
+        quote_plus = Quoter('', plus=True)
+        for text in self.samples:
+            assert quote_plus(text) == urlparse.quote_plus(text)
+
+    def test_quoter_returns_safe_text_unchanged(self):
+        text = 'abc/def'
+        assert Quoter('/')(text) is text
+
+    def test_quoter_accepts_bytes(self):
+        assert Quoter('/')(u('/caf\xe9').encode('utf-8')) == '/caf%C3%A9'
+
+    def test_get_quoter_shares_quoters(self):
+        assert get_quoter('/') is get_quoter('/')
+        assert get_quoter(':') is get_quoter(':')
+        assert get_quoter('') is not get_quoter('', plus=True)
+
+
+class QuotingDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(quoting_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
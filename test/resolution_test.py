@@ -0,0 +1,184 @@
+import doctest
+import unittest
+
+from pytest import raises
+
+from urlobject import resolution as resolution_module
+from urlobject import URLObject
+from urlobject.resolution import BaseURL, merge_paths, resolve_split
+
+
+# The examples from RFC 3986 section 5.4, resolved against its base URL.
+RFC_3986_BASE = 'http://a/b/c/d;p?q'
+RFC_3986_EXAMPLES = {
+    # Normal examples (section 5.4.1).
+    'g:h': 'g:h',
+    'g': 'http://a/b/c/g',
+    './g': 'http://a/b/c/g',
+    'g/': 'http://a/b/c/g/',
+    '/g': 'http://a/g',
+    '//g': 'http://g',
+    '?y': 'http://a/b/c/d;p?y',
+    'g?y': 'http://a/b/c/g?y',
+    '#s': 'http://a/b/c/d;p?q#s',
+    'g#s': 'http://a/b/c/g#s',
+    'g?y#s': 'http://a/b/c/g?y#s',
+    ';x': 'http://a/b/c/;x',
+    'g;x': 'http://a/b/c/g;x',
+    'g;x?y#s': 'http://a/b/c/g;x?y#s',
+    '': 'http://a/b/c/d;p?q',
+    '.': 'http://a/b/c/',
+    './': 'http://a/b/c/',
+    '..': 'http://a/b/',
+    '../': 'http://a/b/',
+    '../g': 'http://a/b/g',
+    '../..': 'http://a/',
+    '../../': 'http://a/',
+    '../../g': 'http://a/g',
+    # Abnormal examples (section 5.4.2).
+    '../../../g': 'http://a/g',
+    '../../../../g': 'http://a/g',
+    '/./g': 'http://a/g',
+    '/../g': 'http://a/g',
+    'g.': 'http://a/b/c/g.',
+    '.g': 'http://a/b/c/.g',
+    'g..': 'http://a/b/c/g..',
+    '..g': 'http://a/b/c/..g',
+    './../g': 'http://a/b/g',
+    './g/.': 'http://a/b/c/g/',
+    'g/./h': 'http://a/b/c/g/h',
+    'g/../h': 'http://a/b/c/h',
+    'g;x=1/./y': 'http://a/b/c/g;x=1/y',
+    'g;x=1/../y': 'http://a/b/c/y',
+    'g?y/./x': 'http://a/b/c/g?y/./x',
+    'g?y/../x': 'http://a/b/c/g?y/../x',
+    'g#s/./x': 'http://a/b/c/g#s/./x',
+    'g#s/../x': 'http://a/b/c/g#s/../x',
+    'http:g': 'http:g',
+}
+
+
+class ResolutionTest(unittest.TestCase):
+
+    def test_relative_resolves_the_rfc_3986_examples(self):
+        base = URLObject(RFC_3986_BASE)
+        for reference, expected in RFC_3986_EXAMPLES.items():
+            assert base.relative(reference) == expected, reference
+
+    def test_relative_accepts_url_objects(self):
+        base = URLObject(RFC_3986_BASE)
+        assert base.relative(URLObject('../g?y')) == 'http://a/b/g?y'
+        assert base.relative(URLObject('https://example.com/')) == 'https://example.com/'
+
+    def test_relative_removes_dot_segments_against_an_empty_base_path(self):
+        base = URLObject('http://example.com')
+        assert base.relative('a/../b') == 'http://example.com/b'
+        assert base.relative('../b') == 'http://example.com/b'
+
+    def test_relative_keeps_empty_path_segments(self):
+        base = URLObject('http://example.com/a//b/c')
+        assert base.relative('d') == 'http://example.com/a//b/d'
+        assert base.relative('../d') == 'http://example.com/a//d'
+
+    def test_relative_keeps_empty_segments_when_removing_dot_segments(self):
+        # urljoin() dropped the empty segment before applying '..'.
+        assert (URLObject('http://a/../c/b/b//').relative('..') ==
+                'http://a/c/b/b/')
+
+    def test_relative_never_reads_a_base_path_as_a_netloc(self):
+        # urljoin() took the '//c' path for a netloc, and kept it.
+        assert URLObject('http://a//c').relative('/./') == 'http://a/'
+        assert URLObject('http://a//c/d').relative('e') == 'http://a//c/e'
+
+    def test_relative_treats_semicolons_as_part_of_a_segment(self):
+        # urljoin() split ';x' off as parameters, leaving a dot segment.
+        assert URLObject('http://a/').relative('.;x') == 'http://a/.;x'
+        assert URLObject('http://a/b/c').relative('..;x') == 'http://a/b/..;x'
+        assert URLObject('http://a/b/c').relative('g;x/../h') == 'http://a/b/h'
+
+    def test_relative_keeps_the_leading_slash_against_a_base_without_netloc(self):
+        # urljoin() dropped the '/' left after removing dot segments, and kept
+        # dot segments for schemes it doesn't know.
+        assert URLObject('foo:a/b').relative('../../c') == 'foo:/c'
+        assert URLObject('foo:').relative('/./a') == 'foo:/a'
+
+    def test_relative_never_turns_a_path_into_a_netloc(self):
+        assert URLObject('/a/b').relative('..//c') == '/.//c'
+        assert URLObject('/a/b').relative('..//c').path == '/.//c'
+
+    def test_resolve_many_resolves_each_reference_in_order(self):
+        base = URLObject(RFC_3986_BASE)
+        references = list(RFC_3986_EXAMPLES)
+        assert (base.resolve_many(references) ==
+                [RFC_3986_EXAMPLES[reference] for reference in references])
+        assert base.resolve_many(iter(['g', '#s'])) == ['http://a/b/c/g',
+                                                       'http://a/b/c/d;p?q#s']
+        assert base.resolve_many([]) == []
+
+    def test_merge_paths_uses_the_base_directory(self):
+        assert merge_paths('/a/b/c', True, 'd') == '/a/b/d'
+        assert merge_paths('/a/b/', True, 'd') == '/a/b/d'
+        assert merge_paths('a', False, 'd') == 'd'
+        assert merge_paths('', False, 'd') == 'd'
+        assert merge_paths('', True, 'd') == '/d'
+
+    def test_resolve_split_returns_references_with_a_scheme_as_they_are(self):
+        reference = ('ftp', 'example.com', '/a/../b', '', '')
+        assert resolve_split(('http', 'a', '/', '', ''), reference) is reference
+
+
+class BaseURLTest(unittest.TestCase):
+
+    def test_resolve_resolves_the_rfc_3986_examples(self):
+        base = BaseURL(RFC_3986_BASE)
+        for reference, expected in RFC_3986_EXAMPLES.items():
+            assert base.resolve(reference) == expected, reference
+
+    def test_resolve_gives_the_same_results_as_relative(self):
+        references = ['', ' g', 'g\n', 'ht\ttp://x/', '//', '///g', '//g?',
+                      '//[::1]:80/g', '//\N{LATIN SMALL LETTER E WITH ACUTE}/g',
+                      '?', '?#s', '#', 'g?', 'g#', '/g?y#', '.', './..', '..//g',
+                      '/a/b/../..', 'g/.', 'g/..', 'v1.2/g', '.hidden', '1a:g',
+                      'a:123', 'a:', '+a:g', 'a b:c', 'g/h:i']
+        for base_url in ['http://a/b/c/d;p?q#f', 'http://a', 'http://a/',
+                         'https://u@a:8080/b//c/./d', '//a/b', 'http:/b/c',
+                         'mailto:a@b.c', 'b/c', '', '?q']:
+            base, url = BaseURL(base_url), URLObject(base_url)
+            for reference in references:
+                assert base.resolve(reference) == url.relative(reference), \
+                    (base_url, reference)
+
+    def test_resolve_raises_like_relative_on_invalid_netlocs(self):
+        base = BaseURL(RFC_3986_BASE)
+        with raises(ValueError):
+            base.resolve('//[::1/g')
+        with raises(ValueError):
+            base.resolve('http://[::1/g')
+
+    def test_resolve_returns_instances_of_the_base_class(self):
+        class MyURL(URLObject):
+            pass
+        base = BaseURL(MyURL(RFC_3986_BASE))
+        for reference in ['g', '/g', '//g', '?y', '#s', '', 'g:h', ' g']:
+            assert type(base.resolve(reference)) is MyURL
+
+    def test_directory_and_segments_come_from_the_base_path(self):
+        base = BaseURL('http://a/b/./c/../d/e?q')
+        assert base.directory == '/b/d/'
+        assert base.segments == ['', 'b', 'd']
+        assert BaseURL('http://a').directory == '/'
+        assert BaseURL('http://a').segments == ['']
+
+    def test_resolve_many_resolves_each_reference_in_order(self):
+        base = BaseURL(RFC_3986_BASE)
+        references = list(RFC_3986_EXAMPLES)
+        assert (base.resolve_many(references) ==
+                [RFC_3986_EXAMPLES[reference] for reference in references])
+
+
+class ResolutionDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(resolution_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
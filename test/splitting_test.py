@@ -0,0 +1,33 @@
+import doctest
+import unittest
+
+from urlobject import splitting as splitting_module
+from urlobject.compat import urlparse
+from urlobject.splitting import SPLIT_URL, SPLIT_URL_BYTES
+
+
+class SplittingTest(unittest.TestCase):
+
+    def test_split_url_agrees_with_urlsplit_on_present_components(self):
+        for url in ['http://user@a:80/b/c?d=e#f', '//a', '/b?', 'b#c',
+                    'mailto:a@b.c', '', 'http:/b', '?q#']:
+            groups = tuple(group or '' for group in SPLIT_URL.match(url).groups())
+            assert groups == tuple(urlparse.urlsplit(url)), url
+
+    def test_split_url_matches_the_whole_string(self):
+        for url in ['http://a/b\nc', '#a#b', 'a b?c d']:
+            assert SPLIT_URL.match(url).end() == len(url)
+
+    def test_bytes_and_text_versions_split_alike(self):
+        for url in ['http://a/b?c#d', '//a', 'b?#', '1a:b']:
+            groups = SPLIT_URL_BYTES.match(url.encode('ascii')).groups()
+            assert tuple(group if group is None else group.decode('ascii')
+                         for group in groups) == SPLIT_URL.match(url).groups()
+
+
+class SplittingDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(splitting_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
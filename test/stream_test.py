@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import bz2
+import doctest
+import gzip
+import io
+import lzma
+import unittest
+
+from urlobject import stream as stream_module
+from urlobject import URLObject
+from urlobject.stream import iter_urls, write_urls
+from urlobject.six import u
+
+
+URLS = ['https://github.com/zacharyvoase/urlobject?spam=eggs#foo',
+        'http://example.com/',
+        'ftp://ftp.example.com/pub/file.txt']
+
+
+class IterURLsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data = ('\n'.join(URLS) + '\n').encode('utf-8')
+
+    def test_reads_text_files(self):
+        urls = list(iter_urls(io.StringIO(self.data.decode('utf-8'))))
+        assert urls == URLS
+        assert all(type(url) is URLObject for url in urls)
+
+    def test_reads_binary_files(self):
+        assert list(iter_urls(io.BytesIO(self.data))) == URLS
+
+    def test_reads_compressed_files(self):
+        for compress in (gzip.compress, bz2.compress, lzma.compress):
+            assert list(iter_urls(io.BytesIO(compress(self.data)))) == URLS
+
+    def test_is_lazy(self):
+        urls = iter_urls(io.BytesIO(self.data))
+        assert next(urls) == URLS[0]
+
+    def test_skips_whitespace_and_blank_lines(self):
+        data = b'\n  http://example.com/  \r\n\r\n'
+        assert list(iter_urls(io.BytesIO(data))) == ['http://example.com/']
+
+    def test_can_read_iris(self):
+        data = u('https://\xe9xample.com/p\xe5th\n').encode('utf-8')
+        assert (list(iter_urls(io.BytesIO(data), iri=True)) ==
+                ['https://xn--xample-9ua.com/p%C3%A5th'])
+
+    def test_reports_malformed_lines_and_carries_on(self):
+        errors = []
+        data = (b'http://example.com:99999/\n'
+                b'http://example.com/\xff\n'
+                b'http://[::1/\n'
+                b'http://example.com/\n')
+        urls = list(iter_urls(io.BytesIO(data),
+                              on_error=lambda *error: errors.append(error)))
+        assert urls == ['http://example.com/']
+        assert [error[:2] for error in errors] == [
+            (1, b'http://example.com:99999/'),
+            (2, b'http://example.com/\xff'),
+            (3, b'http://[::1/')]
+        assert all(isinstance(error[2], ValueError) for error in errors)
+
+    def test_skips_malformed_lines_silently_without_on_error(self):
+        data = b'http://example.com:99999/\nhttp://example.com/\n'
+        assert list(iter_urls(io.BytesIO(data))) == ['http://example.com/']
+
+
+class WriteURLsTest(unittest.TestCase):
+
+    def test_writes_text_files(self):
+        out = io.StringIO()
+        assert write_urls(out, map(URLObject, URLS), buffer_lines=2) == 3
+        assert out.getvalue() == '\n'.join(URLS) + '\n'
+
+    def test_writes_binary_files(self):
+        out = io.BytesIO()
+        assert write_urls(out, URLS) == 3
+        assert out.getvalue() == ('\n'.join(URLS) + '\n').encode('utf-8')
+
+    def test_round_trips_through_gzip(self):
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode='wb') as out:
+            write_urls(out, URLS)
+        assert list(iter_urls(io.BytesIO(buf.getvalue()))) == URLS
+
+    def test_writes_nothing_for_no_urls(self):
+        out = io.StringIO()
+        assert write_urls(out, []) == 0
+        assert out.getvalue() == ''
+
+
+class StreamDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(stream_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
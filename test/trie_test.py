@@ -0,0 +1,120 @@
+import doctest
+import unittest
+
+from pytest import raises
+
+from urlobject import trie as trie_module
+from urlobject import URLObject
+from urlobject.trie import HostIndex, PathTrie
+
+
+class HostIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.urls = [URLObject(url) for url in [
+            'https://github.com/zacharyvoase',
+            'https://gist.github.com/zacharyvoase',
+            'https://api.GitHub.com/users',
+            'http://notgithub.com/',
+            'http://www.google.com/',
+            'http://github.com.evil.example/',
+        ]]
+        self.index = HostIndex(self.urls)
+
+    def test_under_finds_a_domain_and_its_subdomains(self):
+        assert sorted(self.index.under('github.com')) == sorted(self.urls[:3])
+        assert list(self.index.under('gist.github.com')) == [self.urls[1]]
+        assert list(self.index.under('bitbucket.org')) == []
+
+    def test_under_is_case_insensitive_and_ignores_a_trailing_dot(self):
+        assert sorted(self.index.under('GitHub.COM.')) == sorted(self.urls[:3])
+
+    def test_get_only_finds_the_exact_hostname(self):
+        assert self.index.get('github.com') == [self.urls[0]]
+        assert self.index.get('com') == []
+
+    def test_len_and_iter_cover_every_url(self):
+        assert len(self.index) == len(self.urls)
+        assert sorted(self.index) == sorted(self.urls)
+
+    def test_urls_without_a_hostname_are_rejected(self):
+        raises(ValueError, lambda: self.index.add(URLObject('/relative')))
+
+    def test_rules_match_by_longest_suffix(self):
+        rules = HostIndex()
+        rules.add('example.com', 'allow')
+        rules.add('ads.example.com', 'deny')
+        rules.add('ads.example.com', 'log')
+        assert rules.longest_match('x.ads.example.com') == ('ads.example.com', ['deny', 'log'])
+        assert rules.longest_match('ads.example.com') == ('ads.example.com', ['deny', 'log'])
+        assert rules.longest_match('www.example.com') == ('example.com', ['allow'])
+        assert rules.longest_match('badexample.com') is None
+        assert rules.matches('a.ads.example.com') == [
+            ('example.com', ['allow']), ('ads.example.com', ['deny', 'log'])]
+        assert rules.matches('com') == []
+
+    def test_urls_can_be_added_with_a_value(self):
+        index = HostIndex()
+        index.add(self.urls[0], 'payload')
+        assert index.get('github.com') == ['payload']
+
+
+class PathTrieTest(unittest.TestCase):
+
+    def setUp(self):
+        self.routes = PathTrie([
+            ('/api', 'api'),
+            ('/api/v2/', 'v2'),
+            ('/api/*/users', 'users'),
+            ('/api/v2/users', 'v2 users'),
+            ('/a%20b', 'space'),
+        ])
+
+    def test_prefixes_match_whole_segments(self):
+        assert self.routes.longest_match('/api') == ('/api', 'api')
+        assert self.routes.longest_match('/api/') == ('/api', 'api')
+        assert self.routes.longest_match('/api/v3') == ('/api', 'api')
+        assert self.routes.longest_match('/apis') is None
+
+    def test_the_longest_prefix_wins(self):
+        assert self.routes.longest_match('/api/v2/groups') == ('/api/v2/', 'v2')
+        assert self.routes.longest_match('/api/v2/users/1') == ('/api/v2/users', 'v2 users')
+
+    def test_wildcards_match_any_one_segment_but_literals_win(self):
+        assert self.routes.longest_match('/api/v1/users/1') == ('/api/*/users', 'users')
+        assert self.routes.longest_match('/api/v2/users') == ('/api/v2/users', 'v2 users')
+        assert self.routes.longest_match('/api/v1/groups') == ('/api', 'api')
+
+    def test_segments_are_compared_decoded(self):
+        assert self.routes.longest_match('/a b/c') == ('/a%20b', 'space')
+        assert self.routes.longest_match('/a%20b') == ('/a%20b', 'space')
+
+    def test_matches_lists_every_covering_prefix_shortest_first(self):
+        assert self.routes.matches('/api/v2/users') == [
+            ('/api', 'api'), ('/api/v2/', 'v2'),
+            ('/api/*/users', 'users'), ('/api/v2/users', 'v2 users')]
+        assert self.routes.matches('/other') == []
+
+    def test_get_only_matches_the_whole_path(self):
+        assert self.routes.get('/api/v2') == 'v2'
+        assert self.routes.get('/api/v9/users/') == 'users'
+        assert self.routes.get('/api/v2/users/1') is None
+        assert self.routes.get('/api/v2/users/1', 'default') == 'default'
+
+    def test_urls_are_matched_by_path(self):
+        url = URLObject('https://example.com/api/v1/users?page=2')
+        assert self.routes.longest_match(url) == ('/api/*/users', 'users')
+
+    def test_adding_a_prefix_again_replaces_its_value(self):
+        assert len(self.routes) == 5
+        self.routes.add('/api/', 'new api')
+        assert len(self.routes) == 5
+        assert self.routes.longest_match('/api/x') == ('/api/', 'new api')
+
+
+class TrieDoctestsTest(unittest.TestCase):
+
+    def test__doctest(self):
+        result = doctest.testmod(trie_module)
+        self.assertTrue(result.attempted > 0, "No doctests were found")
+        self.assertEqual(result.failed, 0, "There are failed doctests")
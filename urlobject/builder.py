@@ -0,0 +1,274 @@
+from .compat import urlparse
+from .netloc import Netloc
+from .path import URLPath, path_encode
+from .query_string import (QueryString, decoded_param_part, encode_param,
+                           expand_param, get_params_list, qs_decode)
+from .six import text_type, u
+
+
+class URLBuilder(object):
+
+    """
+    A mutable set of URL components, for making many edits in one go.
+
+    Every ``with_*`` method on :class:`~urlobject.URLObject` builds a whole new
+    URL string, which gets split up again by the next method in a chain. A
+    builder holds the split components instead: its methods share names and
+    arguments with those on :class:`~urlobject.URLObject`, but they edit the
+    builder in place and return it, so they can still be chained. The URL is
+    put back together once, by :meth:`.build`.
+
+    The query is kept as a list of decoded parameters once it is first
+    edited, so each ``*_query_param*`` method is a list operation, and the
+    query is only encoded again when the URL is built. The result is the
+    same as the :class:`~urlobject.URLObject` methods give: parameters which
+    those would leave alone keep their original encoding.
+
+    You would usually get a builder from :meth:`URLObject.edit()
+    <urlobject.URLObject.edit>`:
+
+    >>> from urlobject import URLObject
+    >>> url = URLObject("http://www.google.com/search?q=urlobject#top")
+    >>> print(url.edit()
+    ...          .with_scheme("https")
+    ...          .with_port(8443)
+    ...          .set_query_param("q", "python")
+    ...          .without_fragment()
+    ...          .build())
+    https://www.google.com:8443/search?q=python
+    """
+
+    def __init__(self, scheme='', netloc='', path='', query='', fragment='',
+                 url_class=None):
+        if url_class is None:
+            from .urlobject import URLObject as url_class
+        self.url_class = url_class
+        self.scheme = scheme
+        self.netloc = Netloc(netloc)
+        self.path = URLPath(path)
+        self.with_query(query)
+        #: The fragment, in its encoded form.
+        self.fragment = fragment
+
+    def __repr__(self):
+        return u('URLBuilder(%r)') % (text_type(self.build()),)
+
+    @property
+    def query(self):
+        """The query string, encoded."""
+        if self.__params is None:
+            return self.__query
+        parts = []
+        for separator, name, value, raw in self.__params:
+            if parts:
+                parts.append(separator)
+            parts.append(encode_param(name, value) if raw is None else raw)
+        return QueryString(''.join(parts))
+
+    def build(self):
+        """Put the components back together into a new URL."""
+        return self.url_class(urlparse.urlunsplit(
+            (self.scheme, self.netloc, self.path, self.query, self.fragment)))
+
+    def __get_params(self):
+        """
+        The query as a list of ``(separator, name, value, raw)`` parameters.
+
+        ``name`` and ``value`` are decoded, as in :attr:`QueryString.list
+        <urlobject.query_string.QueryString.list>`. ``raw`` is the parameter
+        as it appears in the original query, or ``None`` if it is to be
+        encoded from ``name`` and ``value``. The separator before the first
+        parameter is ignored.
+        """
+        if self.__params is None:
+            params = self.__params = []
+            for separator, raw, name, value in \
+                    self.__query.tokenizer.raw_params(self.__query):
+                if value is not None and ('%' in value or '+' in value):
+                    value = qs_decode(value)
+                params.append((separator, name, value, raw))
+        return self.__params
+
+    def __add_params(self, pairs):
+        params = self.__get_params()
+        for name, value in pairs:
+            name = decoded_param_part(name)
+            if value is not None:
+                value = decoded_param_part(value)
+            elif not params and not name:
+                # Adding an empty parameter to an empty query leaves it empty.
+                continue
+            params.append(('&', name, value, None))
+
+    def __discard_params(self, discard):
+        """Remove the parameters for which ``discard(name, value)`` is true."""
+        params = [param for param in self.__get_params()
+                  if not discard(param[1], param[2])]
+        if len(params) == 1 and not params[0][1] and params[0][2] is None:
+            # All that is left is an empty parameter, i.e. an empty query.
+            params = []
+        self.__params = params
+
+    def __encode_params(self, pairs):
+        """Replace the parameters with ``pairs``, all to be encoded afresh."""
+        params = self.__params = []
+        for name, value in pairs:
+            if params or name or value is not None:
+                params.append(('&', name, value, None))
+
+    def with_scheme(self, scheme):
+        """Replace the scheme."""
+        self.scheme = scheme
+        return self
+
+    def with_netloc(self, netloc):
+        """Replace the whole netloc."""
+        self.netloc = Netloc(netloc)
+        return self
+
+    def with_username(self, username):
+        """Replace or add a username."""
+        self.netloc = self.netloc.with_username(username)
+        return self
+
+    def without_username(self):
+        """Remove any username (and password)."""
+        self.netloc = self.netloc.without_username()
+        return self
+
+    def with_password(self, password):
+        """Replace or add a password; there must be a username."""
+        self.netloc = self.netloc.with_password(password)
+        return self
+
+    def without_password(self):
+        """Remove any password."""
+        self.netloc = self.netloc.without_password()
+        return self
+
+    def with_hostname(self, hostname):
+        """Replace the hostname."""
+        self.netloc = self.netloc.with_hostname(hostname)
+        return self
+
+    def with_port(self, port):
+        """Replace or add a port number."""
+        self.netloc = self.netloc.with_port(port)
+        return self
+
+    def without_port(self):
+        """Remove any port number."""
+        self.netloc = self.netloc.without_port()
+        return self
+
+    def with_auth(self, *auth):
+        """Replace or add a username and (optionally) a password."""
+        self.netloc = self.netloc.with_auth(*auth)
+        return self
+
+    def without_auth(self):
+        """Remove any username and password."""
+        self.netloc = self.netloc.without_auth()
+        return self
+
+    def with_path(self, path):
+        """Replace the path."""
+        self.path = URLPath(path)
+        return self
+
+    def add_path_segment(self, segment):
+        """Add a segment, encoding any ``/`` in it, to the end of the path."""
+        self.path = self.path.add_segment(segment)
+        return self
+
+    def add_path_segments(self, segments):
+        """Add several segments, encoding each, to the end of the path."""
+        self.path = self.path.add_segments(segments)
+        return self
+
+    def add_path(self, partial_path):
+        """Add a partial path, whose ``/`` separate segments, to the path."""
+        self.path = self.path.add(partial_path)
+        return self
+
+    def with_query(self, query):
+        """Replace the query string."""
+        self.__query = QueryString(query)
+        self.__params = None
+        return self
+
+    def without_query(self):
+        """Remove the query string."""
+        return self.with_query('')
+
+    def add_query_param(self, name, value):
+        """Add a parameter, or one for each of a list of values."""
+        self.__add_params(expand_param(name, value))
+        return self
+
+    def add_query_params(self, *args, **kwargs):
+        """Add parameters, given as for :meth:`dict.update`."""
+        for name, value in get_params_list(*args, **kwargs):
+            self.__add_params(expand_param(name, value))
+        return self
+
+    def set_query_param(self, name, value, preserve_encoding=False):
+        """Replace every parameter called ``name`` with one new parameter."""
+        self.del_query_param(name, preserve_encoding)
+        return self.add_query_param(name, value)
+
+    def set_query_params(self, *args, **kwargs):
+        """Set several parameters, given as for :meth:`dict.update`."""
+        params_list = get_params_list(*args, **kwargs)
+        if not params_list:
+            return self
+        # As in QueryString.set_params(), only the last setting of each name
+        # survives, after any untouched parameters.
+        last_set = dict((name, i) for i, (name, _) in enumerate(params_list))
+        pairs = [(name, value) for _, name, value, _ in self.__get_params()
+                 if name not in last_set]
+        for i, (name, value) in enumerate(params_list):
+            pairs.extend((decoded_param_part(n),
+                          None if v is None else decoded_param_part(v))
+                         for n, v in expand_param(name, value)
+                         if last_set.get(n, i) <= i)
+        self.__encode_params(pairs)
+        return self
+
+    def del_query_param(self, name, preserve_encoding=False):
+        """Remove every parameter called ``name``."""
+        if preserve_encoding:
+            self.__discard_params(lambda n, v: n == name)
+        else:
+            self.__encode_params((n, v) for _, n, v, _ in self.__get_params()
+                                 if n != name)
+        return self
+
+    def del_query_params(self, params, preserve_encoding=False):
+        """Remove every parameter with one of the given names."""
+        deleted = set(params)
+        if preserve_encoding:
+            self.__discard_params(lambda n, v: n in deleted)
+        else:
+            self.__encode_params((n, v) for _, n, v, _ in self.__get_params()
+                                 if n not in deleted)
+        return self
+
+    def del_query_param_value(self, name, value, preserve_encoding=False):
+        """Remove every parameter called ``name`` with the value ``value``."""
+        if preserve_encoding:
+            self.__discard_params(lambda n, v: n == name and v == value)
+        else:
+            self.__encode_params((n, v) for _, n, v, _ in self.__get_params()
+                                 if n != name or v != value)
+        return self
+
+    def with_fragment(self, fragment):
+        """Replace the fragment, encoding it."""
+        self.fragment = path_encode(fragment)
+        return self
+
+    def without_fragment(self):
+        """Remove the fragment."""
+        self.fragment = ''
+        return self
@@ -0,0 +1,160 @@
+"""Caching helpers shared by the immutable URL component classes."""
+
+import contextlib
+import functools
+
+
+#: Marks a value which has not been computed yet.
+MISSING = object()
+
+
+class cached_property(property):
+
+    """
+    A read-only property which is computed at most once per instance.
+
+    The URL component classes are immutable, so anything derived from the
+    string itself can be safely stored on the instance after it is first
+    computed. The value lives in the instance ``__dict__``; because this is
+    still a :class:`property`, it keeps working with ``doctest`` and Sphinx.
+    """
+
+    def __init__(self, fget):
+        super(cached_property, self).__init__(fget)
+        # Set explicitly: a property subclass would otherwise report its own
+        # docstring and module, and doctest would skip it as imported.
+        self.__doc__ = fget.__doc__
+        self.__module__ = fget.__module__
+        self.key = fget.__name__
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        # Most instances are short-lived, so avoid the cost of a KeyError.
+        cache = instance.__dict__
+        value = cache.get(self.key, MISSING)
+        if value is MISSING:
+            value = cache[self.key] = self.fget(instance)
+        return value
+
+
+class CodecCache(object):
+
+    """
+    An optional LRU cache for the percent-encoding and decoding functions.
+
+    Real-world URLs repeat the same parameter names and path segments over
+    and over, so caching ``qs_decode``, ``path_decode``, ``qs_encode`` and
+    ``path_encode`` saves most of the (un)quoting. The cache is shared by all
+    of them, and is off by default; each function keeps up to ``maxsize``
+    results while it is on.
+
+    >>> from urlobject.path import URLPath
+    >>> with codec_cache.caching(maxsize=100):
+    ...     segments = [URLPath('/api/v2/users').segments for _ in range(10)]
+    ...     print(codec_cache.info()['path_decode'])
+    CacheInfo(hits=27, misses=3, maxsize=100, currsize=3)
+    >>> codec_cache.is_enabled
+    False
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        #: A :class:`CodecSlot` for each registered function.
+        self.slots = []
+
+    @property
+    def is_enabled(self):
+        return any(slot.cached is not None for slot in self.slots)
+
+    def memoize(self, namespace, key, name):
+        """
+        Register the function at ``namespace[key]``, to cache it when enabled.
+
+        ``namespace`` is the defining module's ``globals()``, and ``key`` the
+        private name its public function calls through, so enabling and
+        disabling the cache only ever swaps that one binding. ``name`` is
+        what :meth:`info` reports the function as.
+        """
+        self.slots.append(CodecSlot(namespace, key, name))
+
+    def enable(self, maxsize=None):
+        """Turn caching on, keeping at most ``maxsize`` results per function."""
+        if maxsize is not None and maxsize != self.maxsize:
+            self.maxsize = maxsize
+            self.disable()
+        for slot in self.slots:
+            if slot.cached is None:
+                slot.install(functools.lru_cache(self.maxsize, typed=True)(
+                    slot.func))
+
+    def disable(self):
+        """Turn caching off, and throw away everything cached."""
+        for slot in self.slots:
+            slot.install(None)
+
+    def clear(self):
+        """Empty the cache, and reset the statistics, but leave it enabled."""
+        for slot in self.slots:
+            if slot.cached is not None:
+                slot.cached.cache_clear()
+
+    def info(self):
+        """A :func:`functools.lru_cache` ``CacheInfo`` for each cached function."""
+        return dict((slot.name, slot.cached.cache_info())
+                    for slot in self.slots if slot.cached is not None)
+
+    @contextlib.contextmanager
+    def caching(self, maxsize=None):
+        """Enable caching for the duration of a ``with`` block."""
+        previous = [slot.cached for slot in self.slots]
+        previous_maxsize = self.maxsize
+        self.enable(maxsize)
+        try:
+            yield self
+        finally:
+            self.maxsize = previous_maxsize
+            for slot, cached in zip(self.slots, previous):
+                slot.install(cached)
+
+
+class CodecSlot(object):
+
+    """
+    The module-level binding through which one codec function is called.
+
+    While the cache is off the binding holds the plain function, so a call
+    costs one plain function call more than the function itself.
+    """
+
+    __slots__ = ('namespace', 'key', 'name', 'func', 'cached')
+
+    def __init__(self, namespace, key, name):
+        self.namespace = namespace
+        self.key = key
+        self.name = name
+        self.func = namespace[key]
+        #: The ``lru_cache`` version of :attr:`func`, or ``None`` while off.
+        self.cached = None
+
+    def install(self, cached):
+        """Bind ``cached``, or the plain function if it is ``None``."""
+        self.cached = cached
+        if cached is None:
+            self.namespace[self.key] = self.func
+            return
+        func = self.func
+
+        @functools.wraps(func)
+        def call(*args):
+            try:
+                return cached(*args)
+            except TypeError:
+                # lru_cache can't hash e.g. a bytearray, so call the function
+                # directly; an error of its own is simply raised again.
+                return func(*args)
+        self.namespace[self.key] = call
+
+
+#: The cache used by :mod:`urlobject.path` and :mod:`urlobject.query_string`.
+codec_cache = CodecCache()
@@ -0,0 +1,271 @@
+"""Canonical forms of URLs, for comparing and deduplicating them."""
+
+import functools
+import hashlib
+import re
+import string
+
+from .path import remove_dot_segments
+from .ports import DEFAULT_PORTS
+from .splitting import SPLIT_URL
+
+
+PERCENT_ESCAPE = re.compile(r'%[0-9A-Fa-f]{2}')
+
+#: Splits a string into text and percent-escapes, which are at odd indices.
+SPLIT_ESCAPES = re.compile(r'(%[0-9A-Fa-f]{2})').split
+
+UNRESERVED = frozenset(string.ascii_letters + string.digits + '-._~')
+
+HEX_DIGITS = '0123456789ABCDEFabcdef'
+
+
+class Normalizer(object):
+
+    """
+    A reusable URL normalizer, following section 6 of RFC 3986.
+
+    Each keyword argument turns one rule on or off:
+
+    ``lowercase_scheme``
+        ``HTTP://`` becomes ``http://``.
+    ``lowercase_host``
+        ``Example.COM`` becomes ``example.com``. The username and password are
+        left alone.
+    ``drop_default_port``
+        Remove the port if it is the default for the scheme (as listed in
+        ``default_ports``), or if it is empty.
+    ``remove_dot_segments``
+        Resolve ``.`` and ``..`` segments in the path.
+    ``uppercase_escapes``
+        ``%c3%a9`` becomes ``%C3%A9``.
+    ``decode_unreserved``
+        Percent-escapes of unreserved characters (letters, digits, ``-._~``)
+        are decoded, so ``%7Euser`` becomes ``~user``.
+    ``empty_path_as_root``
+        A URL with a netloc and an empty path gets a path of ``/``.
+    ``sort_query``
+        Sort the query parameters by name. Parameters with the same name keep
+        their relative order, and are joined with ``&``. Off by default, as
+        the order is significant to some applications.
+    ``drop_empty_query``, ``drop_empty_fragment``
+        Remove a trailing ``?`` or ``#`` with nothing after it.
+    ``drop_fragment``
+        Remove the fragment altogether. Off by default.
+
+    Everything the rules need is worked out when the normalizer is created,
+    and each URL is then split, normalized and put back together in one pass:
+
+    >>> normalize = Normalizer(sort_query=True)
+    >>> print(normalize('HTTP://User@Example.COM:80/a/./b/../%7ec%2f?z=1&a=2#'))
+    http://User@example.com/a/~c%2F?a=2&z=1
+    """
+
+    def __init__(self, lowercase_scheme=True, lowercase_host=True,
+                 drop_default_port=True, remove_dot_segments=True,
+                 uppercase_escapes=True, decode_unreserved=True,
+                 empty_path_as_root=True, sort_query=False,
+                 drop_empty_query=True, drop_empty_fragment=True,
+                 drop_fragment=False, default_ports=DEFAULT_PORTS,
+                 url_class=None):
+        if url_class is None:
+            from .urlobject import URLObject as url_class
+        self.url_class = url_class
+        self.lowercase_scheme = lowercase_scheme
+        self.lowercase_host = lowercase_host
+        self.drop_default_port = drop_default_port
+        self.remove_dot_segments = remove_dot_segments
+        self.empty_path_as_root = empty_path_as_root
+        self.sort_query = sort_query
+        self.drop_empty_query = drop_empty_query
+        self.drop_empty_fragment = drop_empty_fragment
+        self.drop_fragment = drop_fragment
+        self.default_ports = default_ports
+        escapes = escape_table(uppercase_escapes, decode_unreserved)
+        if escapes is None:
+            self.replace_escape = None
+        else:
+            self.replace_escape = lambda match: escapes[match.group()]
+
+    def __call__(self, url):
+        """Normalize a URL, returning a new ``url_class`` instance."""
+        return self.url_class(self.canonical(url))
+
+    def canonical(self, url):
+        """Normalize a URL, returning a plain string."""
+        scheme, netloc, path, query, fragment = SPLIT_URL.match(url).groups()
+        parts = []
+
+        if scheme is not None:
+            if self.lowercase_scheme:
+                scheme = scheme.lower()
+            parts.append(scheme + ':')
+
+        if netloc is not None:
+            parts.append('//' + self.normalize_netloc(netloc, scheme))
+            if not path and self.empty_path_as_root:
+                path = '/'
+
+        path = self.normalize_escapes(path)
+        if self.remove_dot_segments:
+            path = remove_dot_segments(path)
+        parts.append(path)
+
+        if query is not None and (query or not self.drop_empty_query):
+            query = self.normalize_escapes(query)
+            if self.sort_query:
+                query = sort_query(query)
+            parts.append('?' + query)
+
+        if (fragment is not None and not self.drop_fragment and
+                (fragment or not self.drop_empty_fragment)):
+            parts.append('#' + self.normalize_escapes(fragment))
+
+        return ''.join(parts)
+
+    def fingerprint(self, url, algorithm='blake2b', bits=64):
+        """
+        A fixed-width integer hash of the canonical form of a URL.
+
+        URLs with the same canonical form always get the same fingerprint,
+        across processes and Python versions, so fingerprints can stand in
+        for the URLs themselves when deduplicating. ``algorithm`` is any
+        :mod:`hashlib` algorithm, and ``bits`` a multiple of 8 up to its
+        digest size.
+
+        >>> normalizer = Normalizer(sort_query=True)
+        >>> (normalizer.fingerprint('http://example.com:80/?b=2&a=1') ==
+        ...  normalizer.fingerprint('HTTP://EXAMPLE.COM/?a=1&b=2'))
+        True
+        """
+        digest = digest_function(algorithm, bits)
+        return digest(self.canonical(url).encode('utf-8'))
+
+    def normalize_netloc(self, netloc, scheme):
+        userinfo, at, hostport = netloc.rpartition('@')
+        # A colon after an IPv6 literal's closing bracket starts the port.
+        colon = hostport.rfind(':')
+        if colon >= 0 and ']' not in hostport[colon:]:
+            host, port = hostport[:colon], hostport[colon:]
+        else:
+            host, port = hostport, ''
+        # Decode escapes first, so ex%41mple.com is lowercased too.
+        host = self.normalize_escapes(host)
+        if self.lowercase_host:
+            host = lowercase_outside_escapes(host)
+        if self.drop_default_port and scheme is not None:
+            if port == ':' or (port[1:].isdigit() and int(port[1:]) ==
+                               self.default_ports.get(scheme.lower())):
+                port = ''
+        return self.normalize_escapes(userinfo) + at + host + port
+
+    def normalize_escapes(self, component):
+        if self.replace_escape is None or '%' not in component:
+            return component
+        return PERCENT_ESCAPE.sub(self.replace_escape, component)
+
+
+def lowercase_outside_escapes(text):
+    """
+    Lowercase text, except for the hex digits of its percent-escapes.
+
+        >>> lowercase_outside_escapes('Caf%C3%A9.COM')
+        'caf%C3%A9.com'
+    """
+    if '%' not in text:
+        return text.lower()
+    pieces = SPLIT_ESCAPES(text)
+    pieces[::2] = [piece.lower() for piece in pieces[::2]]
+    return ''.join(pieces)
+
+
+def escape_table(uppercase, decode_unreserved):
+    """Map every possible percent-escape to its normalized form."""
+    if not (uppercase or decode_unreserved):
+        return None
+    table = {}
+    for high in HEX_DIGITS:
+        for low in HEX_DIGITS:
+            escape = '%' + high + low
+            char = chr(int(high + low, 16))
+            if decode_unreserved and char in UNRESERVED:
+                table[escape] = char
+            elif uppercase:
+                table[escape] = escape.upper()
+            else:
+                table[escape] = escape
+    return table
+
+
+def sort_query(query):
+    """Stably sort the parameters in a raw query string by name."""
+    params = re.split(r'[&;]', query)
+    params.sort(key=lambda param: param.partition('=')[0])
+    return '&'.join(params)
+
+
+@functools.lru_cache(maxsize=None)
+def digest_function(algorithm='blake2b', bits=64):
+    """Get a function which hashes bytes to a ``bits``-wide integer."""
+    if bits <= 0 or bits % 8:
+        raise ValueError("Fingerprints must be a positive multiple of 8 bits")
+    size = bits // 8
+    if algorithm in ('blake2b', 'blake2s'):
+        # BLAKE2 can produce a digest of the right size directly.
+        constructor = getattr(hashlib, algorithm)
+        if size > constructor.MAX_DIGEST_SIZE:
+            raise ValueError("%s digests are at most %d bits" %
+                             (algorithm, constructor.MAX_DIGEST_SIZE * 8))
+        return lambda data: int.from_bytes(
+            constructor(data, digest_size=size).digest(), 'big')
+
+    constructor = getattr(hashlib, algorithm, None)
+    if constructor is None:
+        constructor = functools.partial(hashlib.new, algorithm)
+    if size > constructor().digest_size:
+        raise ValueError("%s digests are at most %d bits" %
+                         (algorithm, constructor().digest_size * 8))
+    return lambda data: int.from_bytes(constructor(data).digest()[:size], 'big')
+
+
+def fingerprint_many(urls, algorithm='blake2b', bits=64, normalizer=None,
+                     **rules):
+    """
+    Fingerprint many URLs, returning a list of integers.
+
+    This is the same as calling :meth:`Normalizer.fingerprint` on each URL,
+    with a ``normalizer`` made from ``rules`` if none is given, but looks up
+    the normalizer and digest function only once.
+
+    >>> fingerprint_many(['http://example.com/', 'HTTP://example.com:80'], bits=32)
+    [2683981471, 2683981471]
+    """
+    if normalizer is None:
+        normalizer = get_normalizer(**rules)
+    canonical = normalizer.canonical
+    digest = digest_function(algorithm, bits)
+    return [digest(canonical(url).encode('utf-8')) for url in urls]
+
+
+#: Normalizers created by :func:`get_normalizer`, keyed by their rules.
+_normalizers = {}
+
+
+def get_normalizer(**rules):
+    """Get a (shared) :class:`Normalizer` with the given rules."""
+    if rules.get('default_ports') is not None:
+        # Share normalizers by the ports' contents, and keep a copy so later
+        # changes to the mapping can't affect a shared normalizer.
+        rules['default_ports'] = dict(rules['default_ports'])
+    key = tuple(sorted(
+        (name, tuple(sorted(value.items())) if name == 'default_ports' and
+         value is not None else value)
+        for name, value in rules.items()))
+    try:
+        return _normalizers[key]
+    except KeyError:
+        normalizer = _normalizers[key] = Normalizer(**rules)
+        return normalizer
+    except TypeError:
+        # Some other rule can't be hashed, so don't share this normalizer.
+        return Normalizer(**rules)
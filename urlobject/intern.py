@@ -0,0 +1,92 @@
+"""Share one object between equal URLs and URL components, to save memory."""
+
+import collections
+
+from .netloc import Netloc
+from .urlobject import URLObject
+
+
+#: The statistics :meth:`Pool.info` gives for each kind of string.
+PoolInfo = collections.namedtuple('PoolInfo', 'hits misses size')
+
+
+class Pool(object):
+
+    """
+    An interning pool for URLs, netlocs, hostnames and schemes.
+
+    Each method returns the object already in the pool which is equal to its
+    argument, adding the argument if there isn't one. Holding on to only the
+    pooled objects means every distinct string is stored once, however many
+    times it comes up:
+
+    >>> pool = Pool()
+    >>> a = pool.url('http://example.com/a')
+    >>> a is pool.url(URLObject('http://example.com/' + 'a'))
+    True
+    >>> pool.hostname(a.hostname) is pool.hostname(URLObject('https://example.com/').hostname)
+    True
+    >>> pool.info()['url']
+    PoolInfo(hits=1, misses=1, size=1)
+
+    URLs come back as ``url_class`` and netlocs as ``netloc_class`` instances;
+    objects of those types are pooled as they are, without copying. Hostnames
+    and schemes are plain strings.
+
+    The pool keeps everything in it alive until it is cleared (or dropped),
+    so use one per batch of work rather than one for the whole process.
+    """
+
+    KINDS = ('url', 'netloc', 'hostname', 'scheme')
+
+    def __init__(self, url_class=URLObject, netloc_class=Netloc):
+        self.url_class = url_class
+        self.netloc_class = netloc_class
+        self.clear()
+
+    def __len__(self):
+        return sum(len(table) for table in self._tables.values())
+
+    def clear(self):
+        """Empty the pool, and reset its statistics."""
+        self._tables = dict((kind, {}) for kind in self.KINDS)
+        self._hits = dict.fromkeys(self.KINDS, 0)
+        self._misses = dict.fromkeys(self.KINDS, 0)
+
+    def info(self):
+        """A :data:`PoolInfo` for each kind of string in the pool."""
+        return dict((kind, PoolInfo(self._hits[kind], self._misses[kind],
+                                    len(self._tables[kind])))
+                    for kind in self.KINDS)
+
+    def __intern(self, kind, value, cls):
+        table = self._tables[kind]
+        try:
+            shared = table[value]
+        except KeyError:
+            self._misses[kind] += 1
+            if type(value) is not cls:
+                value = cls(value)
+            # The key is the pooled object itself, so nothing else is kept.
+            table[value] = value
+            return value
+        self._hits[kind] += 1
+        return shared
+
+    def url(self, url):
+        """The pooled ``url_class`` instance equal to ``url``."""
+        return self.__intern('url', url, self.url_class)
+
+    def netloc(self, netloc):
+        """The pooled ``netloc_class`` instance equal to ``netloc``."""
+        return self.__intern('netloc', netloc, self.netloc_class)
+
+    def hostname(self, hostname):
+        """The pooled string equal to ``hostname`` (which may be ``None``)."""
+        if hostname is None:
+            return None
+        return self.__intern('hostname', hostname, str)
+
+    def scheme(self, scheme):
+        """The pooled string equal to ``scheme``."""
+        return self.__intern('scheme', scheme, str)
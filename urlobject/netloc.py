@@ -1,4 +1,4 @@
-from .compat import urlparse
+from .cache import cached_property
 from .six import text_type, u
 
 
@@ -14,6 +14,10 @@ class Netloc(text_type):
     def __repr__(self):
         return u('Netloc(%r)') % (text_type(self),)
 
+    def __reduce__(self):
+        # Pickle as the plain string; cached components are rebuilt on demand.
+        return (type(self), (text_type(self),))
+
     @classmethod
     def __unsplit(cls, username, password, hostname, port):
         """Put together a :class:`Netloc` from its constituent parts."""
@@ -23,28 +27,31 @@ class Netloc(text_type):
             if password:
                 auth_string += ':' + password
             auth_string += '@'
+        if ':' in hostname and not hostname.startswith('['):
+            # An IPv6 address goes back in brackets, or it reads as a port.
+            hostname = '[' + hostname + ']'
         port_string = ''
         if port is not None:
             port_string = ':%d' % port
         return cls(auth_string + hostname + port_string)
 
-    @property
+    @cached_property
     def username(self):
         """The username portion of this netloc, or ``None``."""
-        return self.__urlsplit.username
+        return self.__components[0]
 
     def with_username(self, username):
         """Replace or add a username to this netloc."""
-        return self.__replace(username=username)
+        return self.replace(username=username)
 
     def without_username(self):
         """Remove any username (and password) from this netloc."""
-        return self.without_password().with_username('')
+        return self.replace(username=None, password=None)
 
-    @property
+    @cached_property
     def password(self):
         """The password portion of this netloc, or ``None``."""
-        return self.__urlsplit.password
+        return self.__components[1]
 
     def with_password(self, password):
 
@@ -55,13 +62,11 @@ class Netloc(text_type):
         with no username.
         """
 
-        if password and not self.username:
-            raise ValueError("Can't set a password on a netloc with no username")
-        return self.__replace(password=password)
+        return self.replace(password=password)
 
     def without_password(self):
         """Remove any password from this netloc."""
-        return self.with_password('')
+        return self.replace(password=None)
 
     @property
     def auth(self):
@@ -70,45 +75,94 @@ class Netloc(text_type):
 
     def with_auth(self, username, *password):
         """Replace or add a username and password in one method call."""
-        netloc = self.without_auth()
-        if password:
-            return netloc.with_username(username).with_password(*password)
-        return netloc.with_username(username)
+        return self.replace(username=username,
+                            password=password[0] if password else None)
 
     def without_auth(self):
-        return self.without_password().without_username()
+        return self.replace(username=None, password=None)
 
-    @property
+    @cached_property
     def hostname(self):
         """The hostname portion of this netloc."""
-        return self.__urlsplit.hostname
+        return self.__components[2]
 
     def with_hostname(self, hostname):
         """Replace the hostname on this netloc."""
-        return self.__replace(hostname=hostname)
+        return self.replace(hostname=hostname)
 
-    @property
+    @cached_property
     def port(self):
         """The port number on this netloc (as an ``int``), or ``None``."""
-        return self.__urlsplit.port
+        port = self.__components[3]
+        if port is None:
+            return None
+        if not (port.isdigit() and port.isascii()):
+            raise ValueError("Port could not be cast to integer value as %r"
+                             % (port,))
+        port = int(port)
+        if not 0 <= port <= 65535:
+            raise ValueError("Port out of range 0-65535")
+        return port
 
     def with_port(self, port):
         """Replace or add a port number to this netloc."""
-        return self.__replace(port=port)
+        return self.replace(port=port)
 
     def without_port(self):
         """Remove any port number from this netloc."""
-        return self.__replace(port=None)
+        return self.replace(port=None)
 
-    @property
-    def __urlsplit(self):
-        return urlparse.SplitResult('', self, '', '', '')
+    @cached_property
+    def __components(self):
+        """
+        The username, password, hostname and port, parsed in one pass.
+
+        This splits the netloc as ``urlsplit()`` does. The port is left as a
+        string (or ``None``) so that an invalid one only raises when it is
+        read.
+        """
+        userinfo, have_info, hostinfo = self.rpartition('@')
+        if have_info:
+            username, have_password, password = userinfo.partition(':')
+            if not have_password:
+                password = None
+        else:
+            username = password = None
+        _, have_open_bracket, bracketed = hostinfo.partition('[')
+        if have_open_bracket:
+            hostname, _, port = bracketed.partition(']')
+            port = port.partition(':')[2]
+        else:
+            hostname, _, port = hostinfo.partition(':')
+        if hostname:
+            # The zone of a scoped IPv6 address keeps its case.
+            hostname, percent, zone = hostname.partition('%')
+            hostname = hostname.lower() + percent + zone
+        else:
+            hostname = None
+        return username, password, hostname, port or None
+
+    def replace(self, **params):
+        """
+        Replace any of ``username``, ``password``, ``hostname`` and ``port``.
 
-    def __replace(self, **params):
-        """Replace any number of components on this netloc."""
+        The netloc is rebuilt once, however many components change; pass
+        ``None`` to remove one. Like :meth:`with_password`, this raises a
+        ``ValueError`` if the result would have a password but no username.
+
+            >>> print(Netloc('user:pass@example.com:8080').replace(username='zack', port=None))
+            zack:pass@example.com
+        """
         unsplit_args = {'username': self.username,
                         'password': self.password,
                         'hostname': self.hostname,
-                        'port': self.port}
-        unsplit_args.update(params)
+                        # An invalid port can still be replaced.
+                        'port': self.port if 'port' not in params else None}
+        for name, value in params.items():
+            if name not in unsplit_args:
+                raise TypeError("replace() got an unexpected keyword argument %r"
+                                % (name,))
+            unsplit_args[name] = value
+        if 'password' in params and params['password'] and not unsplit_args['username']:
+            raise ValueError("Can't set a password on a netloc with no username")
         return self.__unsplit(**unsplit_args)
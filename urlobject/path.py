@@ -3,7 +3,9 @@
 import posixpath
 import urllib
 
+from .cache import cached_property, codec_cache
 from .compat import urlparse
+from .quoting import get_quoter
 from .six import text_type, u
 
 
@@ -22,18 +24,30 @@ class URLPath(text_type):
     def __repr__(self):
         return u('URLPath(%r)') % (text_type(self),)
 
+    def __reduce__(self):
+        # Pickle as the plain string; cached segments are rebuilt on demand.
+        return (type(self), (text_type(self),))
+
     @classmethod
     def join_segments(cls, segments, absolute=True):
         """Create a :class:`URLPath` from an iterable of segments."""
-        if absolute:
-            path = cls('/')
-        else:
-            path = cls('')
-        for segment in segments:
-            path = path.add_segment(segment)
-        return path
+        return cls(append_segments('/' if absolute else '',
+                                   map(path_encode, segments)))
 
-    @property
+    @cached_property
+    def raw_segments(self):
+        """
+        Split this path into segments, without decoding them.
+
+            >>> URLPath('/a%20b/c%20d/').raw_segments
+            ('a%20b', 'c%20d', '')
+        """
+        segments = tuple(self.split('/'))
+        if segments[0] == '':
+            return segments[1:]
+        return segments
+
+    @cached_property
     def segments(self):
         """
         Split this path into (decoded) segments.
@@ -47,12 +61,9 @@ class URLPath(text_type):
             >>> URLPath('/a%20b/c%20d/').segments
             ('a b', 'c d', '')
         """
-        segments = tuple(map(path_decode, self.split('/')))
-        if segments[0] == '':
-            return segments[1:]
-        return segments
+        return tuple(map(path_decode, self.raw_segments))
 
-    @property
+    @cached_property
     def parent(self):
         """
         The parent of this node.
@@ -62,9 +73,17 @@ class URLPath(text_type):
             >>> URLPath('/foo/bar/').parent
             URLPath('/foo/')
         """
-        if self.is_leaf:
-            return self.relative('.')
-        return self.relative('..')
+        if (not self.startswith('/') or '//' in self or
+                ('.' in self and ('.' in self.raw_segments or
+                                  '..' in self.raw_segments))):
+            # Leave relative paths, empty segments and dot segments to
+            # urljoin(), which has its own rules for them.
+            if self.is_leaf:
+                return self.relative('.')
+            return self.relative('..')
+        # Drop the last segment, and the trailing slash of a non-leaf path.
+        end = len(self) if self.is_leaf else len(self) - 1
+        return type(self)(self[:self.rfind('/', 0, max(end, 1)) + 1])
 
     @property
     def is_leaf(self):
@@ -76,7 +95,7 @@ class URLPath(text_type):
             >>> URLPath('/a/b/').is_leaf
             False
         """
-        return self and self.segments[-1] != '' or False
+        return bool(self) and not self.endswith('/')
 
     @property
     def is_relative(self):
@@ -88,7 +107,7 @@ class URLPath(text_type):
             >>> URLPath('/a/b/c').is_relative
             False
         """
-        return self[0] != '/'
+        return not self.startswith('/')
 
     @property
     def is_absolute(self):
@@ -100,7 +119,24 @@ class URLPath(text_type):
             >>> URLPath('/a/b/c').is_absolute
             True
         """
-        return self[0] == '/'
+        return self.startswith('/')
+
+    @property
+    def depth(self):
+        """
+        The number of segments in this path, not counting a trailing slash.
+
+            >>> URLPath('/a/b/c').depth, URLPath('/a/b/').depth, URLPath('/').depth
+            (3, 2, 0)
+        """
+        if not self:
+            return 0
+        depth = self.count('/') + 1
+        if self.startswith('/'):
+            depth -= 1
+        if self.endswith('/'):
+            depth -= 1
+        return depth
 
     def relative(self, rel_path):
         """
@@ -129,6 +165,18 @@ class URLPath(text_type):
         """
         return type(self)(posixpath.join(self, path_encode(segment)))
 
+    def add_segments(self, segments):
+        """
+        Add several segments to this path at once.
+
+        This is the same as calling :meth:`add_segment` for each one, but
+        builds the new path in one go:
+
+            >>> URLPath('/a/').add_segments(['b', 'c d', 'e/f'])
+            URLPath('/a/b/c%20d/e%2Ff')
+        """
+        return type(self)(append_segments(self, map(path_encode, segments)))
+
     def add(self, path):
         """
         Add a partial path to this one.
@@ -143,6 +191,73 @@ class URLPath(text_type):
         return type(self)(posixpath.join(self, path_encode(path, safe='/')))
 
 
+def append_segments(path, segments):
+    """
+    Append encoded segments to a path, as repeated ``posixpath.join()`` would.
+
+        >>> append_segments('/a', ['b', '', 'c'])
+        '/a/b/c'
+    """
+    parts = [path]
+    empty = not path
+    ends_with_slash = path.endswith('/')
+    for segment in segments:
+        if empty:
+            # Joining onto an empty path just gives the segment.
+            parts.append(segment)
+            empty = not segment
+        else:
+            if not ends_with_slash:
+                parts.append('/')
+            parts.append(segment)
+            ends_with_slash = not segment
+    return ''.join(parts)
+
+
+def remove_dot_segments(path):
+    """
+    Remove ``.`` and ``..`` segments from a path, as in RFC 3986 section 5.2.4.
+
+        >>> remove_dot_segments('/a/b/c/./../../g')
+        '/a/g'
+        >>> remove_dot_segments('mid/content=5/../6')
+        'mid/6'
+    """
+    if '.' not in path:
+        return path
+    output = []
+    i, n = 0, len(path)
+    while i < n:
+        if path.startswith('../', i):
+            i += 3
+        elif path.startswith('./', i):
+            i += 2
+        elif path.startswith('/./', i):
+            i += 2
+        elif path.startswith('/.', i) and i + 2 == n:
+            output.append('/')
+            i = n
+        elif path.startswith('/../', i):
+            i += 3
+            if output:
+                output.pop()
+        elif path.startswith('/..', i) and i + 3 == n:
+            if output:
+                output.pop()
+            output.append('/')
+            i = n
+        elif path[i] == '.' and (i + 1 == n or (i + 2 == n and path[i + 1] == '.')):
+            i = n
+        else:
+            # Move the first segment (and any leading slash) to the output.
+            end = path.find('/', i + 1)
+            if end < 0:
+                end = n
+            output.append(path[i:end])
+            i = end
+    return ''.join(output)
+
+
 def _path_encode_py2(s, safe=''):
     """Quote unicode or str using path rules."""
     if isinstance(s, unicode):
@@ -156,7 +271,7 @@ def _path_encode_py3(s, safe=''):
     """Quote str or bytes using path rules."""
     # s can be bytes or unicode, urllib.parse.quote() assumes
     # utf-8 if encoding is necessary.
-    return urlparse.quote(s, safe=safe)
+    return get_quoter(safe)(s)
 
 
 def _path_decode_py2(s):
@@ -174,12 +289,25 @@ def _path_decode_py3(s):
 
 
 if hasattr(urllib, 'quote'):
-    path_encode = _path_encode_py2
-    path_decode = _path_decode_py2
+    _path_encode = _path_encode_py2
+    _path_decode = _path_decode_py2
     del _path_encode_py3
     del _path_decode_py3
 else:
-    path_encode = _path_encode_py3
-    path_decode = _path_decode_py3
+    _path_encode = _path_encode_py3
+    _path_decode = _path_decode_py3
     del _path_encode_py2
     del _path_decode_py2
+
+codec_cache.memoize(globals(), '_path_encode', 'path_encode')
+codec_cache.memoize(globals(), '_path_decode', 'path_decode')
+
+
+def path_encode(s, safe=''):
+    """Quote str or bytes using path rules, through the codec cache."""
+    return _path_encode(s, safe)
+
+
+def path_decode(s):
+    """Unquote str or bytes using path rules, through the codec cache."""
+    return _path_decode(s)
@@ -1,41 +1,159 @@
 import collections
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+import itertools
 import re
 import urllib
 
+from .cache import cached_property, codec_cache
 from .compat import urlparse
+from .quoting import get_quoter
 from .six import PY2, text_type, string_types, u
 
 
-class QueryString(text_type):
+class QueryTokenizer(object):
+
+    """
+    Splits query strings into decoded ``(name, value)`` pairs.
+
+    ``separators`` are the characters which may separate parameters. The
+    regular expressions are compiled once, here, and each name or value is
+    only unquoted if it contains a ``%`` or ``+``.
+
+    >>> QueryTokenizer('&').tokenize('a=1;b=2&c+d=%7E&e')
+    [('a', '1;b=2'), ('c d', '~'), ('e', None)]
+    >>> QueryTokenizer('&;').tokenize('a=1;b=2&c+d=%7E&e')
+    [('a', '1'), ('b', '2'), ('c d', '~'), ('e', None)]
+    """
+
+    def __init__(self, separators='&;'):
+        if not separators:
+            raise ValueError("A query tokenizer needs at least one separator")
+        self.separators = separators
+        pattern = '[%s]' % re.escape(separators)
+        #: Split a query string into its raw parameters.
+        self.split = re.compile(pattern).split
+        #: Split a query string, keeping the separators between parameters.
+        self.split_keeping_separators = re.compile('(%s)' % pattern).split
+        self.delimiters = re.compile('[%s]' % re.escape(separators + '=%+'))
 
     def __repr__(self):
-        return u('QueryString(%r)') % (text_type(self),)
+        return 'QueryTokenizer(%r)' % (self.separators,)
 
-    @property
-    def list(self):
+    def tokenize(self, query):
+        """Split ``query`` into a list of decoded ``(name, value)`` pairs."""
         result = []
-        if not self:
-            # Empty string => empty list.
-            return result
+        append = result.append
+        for _, _, name, value in self.raw_params(query):
+            if value is not None and ('%' in value or '+' in value):
+                value = qs_decode(value)
+            append((name, value))
+        return result
+
+    def raw_params(self, query):
+        """
+        Yield ``(separator, raw, name, raw_value)`` for each parameter.
+
+        ``separator`` is the one before the parameter (``''`` for the
+        first), ``raw`` is the parameter as it appears in ``query``, and
+        ``name`` is its decoded name. ``raw_value`` is the value as it
+        appears, still encoded: ``None`` for a parameter without an ``=``.
 
-        name_value_pairs = re.split(r'[\&\;]', self)
-        for name_value_pair in name_value_pairs:
-            # Split the pair string into a naive, encoded (name, value) pair.
-            name_value = name_value_pair.split('=', 1)
+        >>> for param in QueryTokenizer('&;').raw_params('a=1;b+c=%7E&d'):
+        ...     print(param)
+        ('', 'a=1', 'a', '1')
+        (';', 'b+c=%7E', 'b c', '%7E')
+        ('&', 'd', 'd', None)
+        """
+        if not query:
+            return
+        tokens = self.split_keeping_separators(query)
+        # tokens alternates parameters and the separators between them.
+        separators = tokens[1::2]
+        separators.insert(0, '')
+        for separator, raw in zip(separators, tokens[::2]):
             # 'param' => ('param', None)
-            if len(name_value) == 1:
-                name, value = name_value + [None]
             # 'param=value' => ('param', 'value')
             # 'param=' => ('param', '')
-            else:
-                name, value = name_value
+            name, equals, value = raw.partition('=')
+            if '%' in name or '+' in name:
+                name = qs_decode(name)
+            yield separator, raw, name, value if equals else None
 
-            name = qs_decode(name)
-            if value is not None:
-                value = qs_decode(value)
 
-            result.append((name, value))
-        return result
+class QueryString(text_type):
+
+    #: How the parameters are split up. Override this in a subclass to use
+    #: other separators; the default accepts both ``&`` and ``;``.
+    tokenizer = QueryTokenizer('&;')
+
+    def __repr__(self):
+        return u('QueryString(%r)') % (text_type(self),)
+
+    def __reduce__(self):
+        # Pickle as the plain string; cached params are rebuilt on demand.
+        return (type(self), (text_type(self),))
+
+    @property
+    def list(self):
+        return self.tokenizer.tokenize(self)
+
+    @cached_property
+    def params(self):
+        """
+        A read-only multi-dict view of the parameters, built once and cached.
+
+        Looking up a name decodes only the values stored under it, which is
+        much cheaper than :attr:`dict` or :attr:`multi_dict` when you need a
+        few parameters out of many. See :class:`QueryParams`.
+
+        >>> params = QueryString('a=1&b=2&a=3&c').params
+        >>> params['a'], params.getall('a'), params.get('c'), params.count('a')
+        ('3', ['1', '3'], None, 2)
+        """
+        return QueryParams(self, self.tokenizer)
+
+    def get_param(self, name, default=None):
+        """
+        The last value for ``name``, or ``default`` if it isn't present.
+
+        This matches ``dict.get(name, default)``, but the raw query is
+        scanned from the end for ``name``, and only its value is decoded.
+
+        >>> QueryString('a=1&b=x+y&a=2').get_param('a')
+        '2'
+        >>> QueryString('a=1&b=x+y&a=2').get_param('b')
+        'x y'
+        """
+        if not self:
+            return default
+        tokenizer = self.tokenizer
+        if ('%' in self or '+' in self or not name or
+                tokenizer.delimiters.search(name)):
+            for _, _, param_name, value in reversed(
+                    list(tokenizer.raw_params(self))):
+                if param_name != name:
+                    continue
+                if value is not None and ('%' in value or '+' in value):
+                    return qs_decode(value)
+                return value
+            return default
+
+        # Nothing in the query is encoded, so look for the name itself.
+        end = len(self)
+        while True:
+            start = self.rfind(name, 0, end)
+            if start < 0:
+                return default
+            end = start + len(name)
+            if start == 0 or self[start - 1] in tokenizer.separators:
+                if end == len(self) or self[end] in tokenizer.separators:
+                    return None
+                if self[end] == '=':
+                    return tokenizer.split(self[end + 1:], 1)[0]
+            end -= 1
 
     @property
     def dict(self):
@@ -49,56 +167,152 @@ class QueryString(text_type):
         return dict(result)
 
     def add_param(self, name, value):
-        if value is None:
-            parameter = qs_encode(name)
-        elif not isinstance(value, string_types) and hasattr(value, '__iter__'):
-            # value is a list or tuple
-            parameter = '&'.join([qs_encode(name) + '=' + qs_encode(val) for val in value])
-        else:
-            parameter = qs_encode(name) + '=' + qs_encode(value)
+        parameter = encode_param(name, value)
         if self:
             return type(self)(self + '&' + parameter)
         return type(self)(parameter)
 
     def add_params(self, *args, **kwargs):
         params_list = get_params_list(*args, **kwargs)
-        new = self
-        for name, value in params_list:
-            new = new.add_param(name, value)
-        return new
+        parameters = [self]
+        parameters.extend(encode_param(name, value)
+                          for name, value in params_list)
+        return type(self)(join_params(parameters))
 
-    def del_param(self, name):
+    def del_param(self, name, preserve_encoding=False):
+        if preserve_encoding:
+            return type(self)(discard_raw_params(
+                self, self.tokenizer, lambda n, raw_value: n == name))
         params = [(n, v) for n, v in self.list if n != name]
-        qs = type(self)('')
-        for param in params:
-            qs = qs.add_param(*param)
-        return qs
+        return type(self)(join_params(encode_param(*param)
+                                      for param in params))
 
-    def set_param(self, name, value):
-        return self.del_param(name).add_param(name, value)
+    def set_param(self, name, value, preserve_encoding=False):
+        return self.del_param(name, preserve_encoding).add_param(name, value)
 
     def set_params(self, *args, **kwargs):
         params_list = get_params_list(*args, **kwargs)
-        new = self
-        for name, value in params_list:
-            new = new.set_param(name, value)
-        return new
+        if not params_list:
+            return self
+        # Setting a name removes every earlier parameter with that name, so
+        # only the last setting of each name survives, after any untouched
+        # parameters already in the query string.
+        last_set = dict((name, i) for i, (name, _) in enumerate(params_list))
+        params = [(name, value) for name, value in self.list
+                  if name not in last_set]
+        for i, (name, value) in enumerate(params_list):
+            params.extend(param for param in expand_param(name, value)
+                          if last_set.get(param[0], i) <= i)
+        return type(self)(join_params(encode_param(*param)
+                                      for param in params))
 
-    def del_params(self, params):
+    def del_params(self, params, preserve_encoding=False):
         deleted = set(params)
+        if preserve_encoding:
+            return type(self)(discard_raw_params(
+                self, self.tokenizer, lambda name, raw_value: name in deleted))
         params = [(name, value) for name, value in self.list
                   if name not in deleted]
-        qs = type(self)('')
-        for param in params:
-            qs = qs.add_param(*param)
-        return qs
+        return type(self)(join_params(encode_param(*param)
+                                      for param in params))
 
-    def del_param_value(self, name, value):
+    def del_param_value(self, name, value, preserve_encoding=False):
+        if preserve_encoding:
+            return type(self)(discard_raw_params(
+                self, self.tokenizer, lambda n, raw_value: n == name and
+                (raw_value if raw_value is None else qs_decode(raw_value)) == value))
         params = [(n, v) for n, v in self.list if n != name or v != value]
-        qs = type(self)('')
-        for param in params:
-            qs = qs.add_param(*param)
-        return qs
+        return type(self)(join_params(encode_param(*param)
+                                      for param in params))
+
+
+class QueryParams(Mapping):
+
+    """
+    An ordered, read-only multi-dict of the parameters in a query string.
+
+    As with :attr:`QueryString.dict`, ``params[name]`` and ``get(name)`` give
+    the last value for a name; ``getall(name)`` gives all of them, in order.
+    Valueless parameters (``?flag``) have a value of ``None``. Iterating gives
+    each distinct name once, in order of first appearance.
+
+    Names are decoded when the view is built, but only if they contain an
+    escape, and values are only decoded when they are looked up.
+    """
+
+    __slots__ = ('_names', '_values', '_index')
+
+    def __init__(self, query, tokenizer=QueryString.tokenizer):
+        self._names = names = []
+        self._values = values = []
+        self._index = index = {}
+        for _, _, name, value in tokenizer.raw_params(query):
+            index.setdefault(name, []).append(len(names))
+            names.append(name)
+            values.append(value)
+
+    def __repr__(self):
+        return 'QueryParams(%r)' % (self.list(),)
+
+    def _value(self, i):
+        value = self._values[i]
+        if value is None or ('%' not in value and '+' not in value):
+            return value
+        return qs_decode(value)
+
+    def __getitem__(self, name):
+        return self._value(self._index[name][-1])
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, name, default=None):
+        """The last value for ``name``, or ``default`` if it isn't present."""
+        positions = self._index.get(name)
+        if positions is None:
+            return default
+        return self._value(positions[-1])
+
+    def getall(self, name):
+        """All the values for ``name`` in order, or an empty list."""
+        return [self._value(i) for i in self._index.get(name, ())]
+
+    def count(self, name):
+        """The number of parameters called ``name``."""
+        return len(self._index.get(name, ()))
+
+    def list(self):
+        """Every ``(name, value)`` pair, as :attr:`QueryString.list` gives."""
+        return [(name, self._value(i)) for i, name in enumerate(self._names)]
+
+
+def discard_raw_params(query, tokenizer, discard):
+    """
+    Remove parameters from a raw query string, leaving the rest untouched.
+
+    ``discard(name, raw_value)`` is called with each parameter's decoded name
+    and its value as it appears in the query (``None`` if it has no ``=``).
+    The parameters which are kept are copied across unchanged, each with the
+    separator that came before it, so their encoding is preserved.
+
+    >>> discard_raw_params('a=1;b=x%20y&c=%7E', QueryString.tokenizer,
+    ...                    lambda name, value: name == 'a')
+    'b=x%20y&c=%7E'
+    """
+    parts = []
+    for separator, param, name, value in tokenizer.raw_params(query):
+        if discard(name, value):
+            continue
+        if parts:
+            parts.append(separator)
+        parts.append(param)
+    return ''.join(parts)
 
 
 def get_params_list(*args, **kwargs):
@@ -117,6 +331,60 @@ def get_params_list(*args, **kwargs):
     return params
 
 
+def encode_param(name, value):
+    """Encode a name/value pair as one or more ``name=value`` parameters."""
+    if value is None:
+        return qs_encode(name)
+    elif not isinstance(value, string_types) and hasattr(value, '__iter__'):
+        # value is a list or tuple
+        return '&'.join([qs_encode(name) + '=' + qs_encode(val) for val in value])
+    return qs_encode(name) + '=' + qs_encode(value)
+
+
+def expand_param(name, value):
+    """Split a name/value pair with a list of values into single pairs."""
+    if (value is None or isinstance(value, string_types) or
+            not hasattr(value, '__iter__')):
+        return [(name, value)]
+    values = list(value)
+    if not values:
+        # An empty list encodes to an empty parameter, read back as ('', None).
+        return [('', None)]
+    return [(name, val) for val in values]
+
+
+def decoded_param_part(part):
+    """
+    A name or value as it would read back once encoded and decoded again.
+
+    Text is returned as it is; other values (such as numbers) go through
+    :func:`qs_encode`, so they fail or are converted just as they would be
+    when encoded.
+
+        >>> decoded_param_part('a b'), decoded_param_part(3)
+        ('a b', '3')
+    """
+    if isinstance(part, text_type):
+        return part
+    return qs_decode(qs_encode(part))
+
+
+def join_params(parameters):
+    """
+    Join encoded parameters with ``&``, as repeated ``add_param()`` calls would.
+
+    Empty parameters at the start are dropped, because adding an empty
+    parameter to an empty query string leaves it empty.
+    """
+    parameters = iter(parameters)
+    for first in parameters:
+        if first:
+            break
+    else:
+        return ''
+    return '&'.join(itertools.chain([first], parameters))
+
+
 def _qs_encode_py2(s):
     """Quote unicode or str using query string rules."""
     if isinstance(s, (int, long)):
@@ -128,6 +396,9 @@ def _qs_encode_py2(s):
     return urllib.quote_plus(s).decode('utf-8')
 
 
+_quote_plus = get_quoter('', plus=True)
+
+
 def _qs_encode_py3(s):
     """Quote str or bytes using query string rules."""
     if isinstance(s, int):
@@ -135,7 +406,7 @@ def _qs_encode_py3(s):
         s = str(s)
     # s can be bytes or unicode, urllib.parse.quote() assumes
     # utf-8 if encoding is necessary.
-    return urlparse.quote_plus(s)
+    return _quote_plus(s)
 
 
 def _qs_decode_py2(s):
@@ -153,12 +424,25 @@ def _qs_decode_py3(s):
 
 
 if PY2:
-    qs_encode = _qs_encode_py2
-    qs_decode = _qs_decode_py2
+    _qs_encode = _qs_encode_py2
+    _qs_decode = _qs_decode_py2
     del _qs_encode_py3
     del _qs_decode_py3
 else:
-    qs_encode = _qs_encode_py3
-    qs_decode = _qs_decode_py3
+    _qs_encode = _qs_encode_py3
+    _qs_decode = _qs_decode_py3
     del _qs_encode_py2
     del _qs_decode_py2
+
+codec_cache.memoize(globals(), '_qs_encode', 'qs_encode')
+codec_cache.memoize(globals(), '_qs_decode', 'qs_decode')
+
+
+def qs_encode(s):
+    """Quote str or bytes using query string rules, through the codec cache."""
+    return _qs_encode(s)
+
+
+def qs_decode(s):
+    """Unquote str or bytes using query string rules, through the codec cache."""
+    return _qs_decode(s)
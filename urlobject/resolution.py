@@ -0,0 +1,182 @@
+"""Resolve URL references against a base URL, as in RFC 3986 section 5.2."""
+
+from .compat import urlparse
+from .path import URLPath, remove_dot_segments
+from .splitting import SPLIT_URL
+
+
+def merge_paths(base_path, base_has_netloc, path):
+    """
+    Merge a relative path with the path of its base, as in RFC 3986 5.2.3.
+
+        >>> merge_paths('/a/b/c', True, 'd/e')
+        '/a/b/d/e'
+        >>> merge_paths('', True, 'd')
+        '/d'
+    """
+    if base_has_netloc and not base_path:
+        return '/' + path
+    return base_path[:base_path.rfind('/') + 1] + path
+
+
+def resolve_split(base, reference):
+    """
+    Resolve a split reference against a split base URL.
+
+    Both arguments, and the result, are ``(scheme, netloc, path, query,
+    fragment)`` tuples as returned by ``urlsplit()``, so a component which is
+    missing is an empty string. This follows the algorithm in RFC 3986 section
+    5.2.2, except that (like ``urljoin()``) a reference with a scheme or netloc
+    is used as it is, without removing dot segments from its path:
+
+        >>> resolve_split(('http', 'a', '/b/c/d', 'q', ''),
+        ...               ('', '', '../g', '', 'f'))
+        ('http', 'a', '/b/g', '', 'f')
+        >>> resolve_split(('http', 'a', '/b/c/d', 'q', ''),
+        ...               ('', '', '', '', 'f'))
+        ('http', 'a', '/b/c/d', 'q', 'f')
+    """
+    scheme, netloc, path, query, fragment = reference
+    if scheme:
+        return reference
+    base_scheme, base_netloc, base_path, base_query, _ = base
+    if netloc:
+        return base_scheme, netloc, path, query, fragment
+    if not path:
+        return base_scheme, base_netloc, base_path, query or base_query, fragment
+    if not path.startswith('/'):
+        path = merge_paths(base_path, bool(base_netloc), path)
+    path = remove_dot_segments(path)
+    if not base_netloc and path.startswith('//'):
+        # Keep the path from being read back as a netloc.
+        path = '/.' + path
+    return base_scheme, base_netloc, path, query, fragment
+
+
+class BaseURL(object):
+
+    """
+    A base URL, split up once, for resolving many references against it.
+
+    :meth:`URLObject.relative <urlobject.URLObject.relative>` splits the
+    reference and then the (cached) base on every call. A :class:`BaseURL`
+    instead keeps the parts of the base that resolution needs: the base
+    without its fragment, its origin, and its directory as a :class:`URLPath
+    <urlobject.path.URLPath>` and as a stack of segments. References in the
+    most common shapes (absolute URLs, ``//host/...``, ``/path``, ``?query``
+    and ``#fragment``, and plain relative paths) are then resolved with one
+    regex match and some string concatenation; anything else, including
+    references whose scheme ``urlsplit()`` reads differently between Python
+    versions, goes through :meth:`~urlobject.URLObject.relative`, so the
+    results are always the same.
+
+    >>> base = BaseURL('http://www.google.com/a/b/c?d=e#f')
+    >>> base.directory
+    URLPath('/a/b/')
+    >>> for url in base.resolve_many(['g', '../h', '/i', '?j', '#k',
+    ...                               '//example.com/l', 'https://github.com/']):
+    ...     print(url)
+    http://www.google.com/a/b/g
+    http://www.google.com/a/h
+    http://www.google.com/i
+    http://www.google.com/a/b/c?j
+    http://www.google.com/a/b/c?d=e#k
+    http://example.com/l
+    https://github.com/
+    """
+
+    def __init__(self, url):
+        from .urlobject import URLObject
+        if not isinstance(url, URLObject):
+            url = URLObject(url)
+        self.url = url
+        self.url_class = type(url)
+        scheme, netloc, path, query, _ = urlparse.urlsplit(url)
+        #: What an empty reference (or one with just a fragment) resolves to.
+        self.document = urlparse.urlunsplit((scheme, netloc, path, query, ''))
+        #: The base without its query, for references with just a query.
+        self.location = urlparse.urlunsplit((scheme, netloc, path, '', ''))
+        self.scheme_prefix = scheme + ':' if scheme else ''
+        if netloc:
+            self.origin = urlparse.urlunsplit((scheme, netloc, '', '', ''))
+            self.directory = URLPath(remove_dot_segments(
+                merge_paths(path, True, '')))
+            self.segments = self.directory.split('/')[:-1]
+        else:
+            # Without a netloc, the rarer corner cases of merging paths come
+            # up, so leave those to URLObject.relative().
+            self.origin = self.directory = self.segments = None
+
+    def __repr__(self):
+        return 'BaseURL(%r)' % (self.url,)
+
+    def resolve(self, reference):
+        """Resolve a reference (e.g. a link on the page) against this base."""
+        if not reference:
+            return self.url_class(self.document)
+        if (reference[0] <= ' ' or '\t' in reference or '\n' in reference or
+                '\r' in reference):
+            # urlsplit() strips or removes these, so let it handle them.
+            return self.url.relative(reference)
+        scheme, netloc, path, query, fragment = SPLIT_URL.match(
+            reference).groups()
+        if netloc and (not netloc.isascii() or '[' in netloc or
+                       ']' in netloc):
+            # urlsplit() may reject these, so let it.
+            return self.url.relative(reference)
+        if scheme is not None:
+            rest = reference[len(scheme) + 1:]
+            if not rest or rest.strip('0123456789'):
+                return self.url_class(reference)
+            # Python 3.8 reads 'name:123' as a path ending in a port number.
+            return self.url.relative(reference)
+        if netloc is None and ':' in path.partition('/')[0]:
+            # Before 3.10, urlsplit() also takes e.g. '1a:' for a scheme.
+            return self.url.relative(reference)
+        if netloc:
+            url = self.scheme_prefix + '//' + netloc + path
+        elif not path:
+            if query:
+                url = self.location + '?' + query
+            else:
+                url = self.document
+            return self.url_class(url + '#' + fragment if fragment else url)
+        elif self.origin is None or netloc is not None:
+            return self.url.relative(reference)
+        elif path.startswith('/'):
+            url = self.origin + remove_dot_segments(path)
+        elif path.startswith('.') or '/.' in path:
+            url = self.origin + self.__merge_dot_segments(path)
+        else:
+            url = self.origin + self.directory + path
+        if query:
+            url += '?' + query
+        if fragment:
+            url += '#' + fragment
+        return self.url_class(url)
+
+    def __merge_dot_segments(self, path):
+        """Merge a path with dot segments onto the directory's segments."""
+        segments = list(self.segments)
+        parts = path.split('/')
+        last = parts.pop()
+        for part in parts:
+            if part == '..':
+                if len(segments) > 1:
+                    segments.pop()
+            elif part != '.':
+                segments.append(part)
+        if last == '..':
+            if len(segments) > 1:
+                segments.pop()
+            segments.append('')
+        elif last == '.':
+            segments.append('')
+        else:
+            segments.append(last)
+        return '/'.join(segments)
+
+    def resolve_many(self, references):
+        """Resolve each reference in an iterable, returning a list."""
+        resolve = self.resolve
+        return [resolve(reference) for reference in references]
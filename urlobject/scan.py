@@ -0,0 +1,248 @@
+"""Scan large files of URLs in place, through a memory map."""
+
+import mmap
+
+from .netloc import Netloc
+from .path import URLPath, path_decode
+from .query_string import QueryString
+from .splitting import SPLIT_URL_BYTES
+from .urlobject import URLObject
+
+
+#: The regex group for each component matched by
+#: :data:`~urlobject.splitting.SPLIT_URL_BYTES`.
+COMPONENT_GROUPS = {'scheme': 1, 'netloc': 2, 'path': 3, 'query': 4,
+                    'fragment': 5}
+
+
+class URLDump(object):
+
+    """
+    A file of URLs, one per line, read through a memory map.
+
+    Iterating over a dump yields a :class:`ScannedURL` for each non-blank
+    line. These only record where the line and its components are in the
+    file; nothing is decoded or copied until you ask for a component, so
+    filtering with :meth:`filter` (or your own checks on the spans) is cheap.
+
+    :meth:`startswith` finds lines by prefix with a binary search, for files
+    sorted bytewise (e.g. with ``LC_ALL=C sort``).
+
+    ``source`` is a filename, or a binary file object with a ``fileno()``
+    (which is left open). Use the dump as a context manager, or call
+    :meth:`close`, to release the memory map.
+    """
+
+    def __init__(self, source, encoding='utf-8', url_class=URLObject):
+        self.encoding = encoding
+        self.url_class = url_class
+        if hasattr(source, 'fileno'):
+            self._file = None
+            fileno = source.fileno()
+        else:
+            self._file = open(source, 'rb')
+            fileno = self._file.fileno()
+        try:
+            self.buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped.
+            self.buffer = b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __iter__(self):
+        return self.scan()
+
+    def scan(self, start=0):
+        """Yield a :class:`ScannedURL` for each line from offset ``start``."""
+        buf = self.buffer
+        size = len(buf)
+        match = SPLIT_URL_BYTES.match
+        pos = start
+        while pos < size:
+            newline = buf.find(b'\n', pos)
+            if newline < 0:
+                newline = size
+            end = newline
+            if end > pos and buf[end - 1] == 13:  # '\r'
+                end -= 1
+            if end > pos:
+                yield ScannedURL(self, match(buf, pos, end))
+            pos = newline + 1
+
+    def filter(self, hostname=None, path_prefix=None):
+        """
+        Yield the URLs with a given hostname and/or path prefix.
+
+        ``hostname`` is compared case-insensitively. ``path_prefix`` is
+        compared with the raw path, so give it in its encoded form. Rows which
+        don't match are never decoded.
+        """
+        if hostname is not None:
+            hostname = hostname.lower().encode(self.encoding)
+        if path_prefix is not None:
+            path_prefix = path_prefix.encode(self.encoding)
+        for url in self.scan():
+            if hostname is not None and not url.has_hostname(hostname):
+                continue
+            if path_prefix is not None and not url.has_path_prefix(path_prefix):
+                continue
+            yield url
+
+    def startswith(self, prefix):
+        """
+        Yield the URLs starting with ``prefix``, in a bytewise-sorted file.
+
+        A binary search finds the first matching line, so this only reads the
+        lines it yields plus a few dozen more.
+        """
+        if not isinstance(prefix, bytes):
+            prefix = prefix.encode(self.encoding)
+        buf = self.buffer
+        low, high = 0, len(buf)
+        # Invariant: lines starting before `low` sort below the prefix, and
+        # the line starting at `high` (if any) doesn't.
+        while low < high:
+            line_start = buf.rfind(b'\n', 0, (low + high) // 2) + 1
+            line_end = buf.find(b'\n', line_start)
+            if line_end < 0:
+                line_end = len(buf)
+            if buf[line_start:line_end] < prefix:
+                low = line_end + 1
+            else:
+                high = line_start
+        for url in self.scan(low):
+            if not url.has_prefix(prefix):
+                break
+            yield url
+
+
+class ScannedURL(object):
+
+    """
+    The location of one URL, and its components, within a :class:`URLDump`.
+
+    Offsets are into the dump's buffer. The component properties (which have
+    the same names and types as on :class:`~urlobject.URLObject`) decode the
+    relevant bytes each time they are accessed.
+    """
+
+    __slots__ = ('dump', 'match')
+
+    def __init__(self, dump, match):
+        self.dump = dump
+        self.match = match
+
+    def __repr__(self):
+        return 'ScannedURL(%r)' % (self.raw,)
+
+    @property
+    def start(self):
+        """The offset of the start of this URL."""
+        return self.match.start()
+
+    @property
+    def end(self):
+        """The offset of the end of this URL."""
+        return self.match.end()
+
+    def span(self, component):
+        """
+        The ``(start, end)`` offsets of a component, or ``None`` if absent.
+
+        ``component`` is one of ``'scheme'``, ``'netloc'``, ``'path'``,
+        ``'query'`` or ``'fragment'``. The delimiters (``:``, ``//``, ``?``
+        and ``#``) are not included in the span.
+        """
+        start, end = self.match.span(COMPONENT_GROUPS[component])
+        if start < 0:
+            return None
+        return start, end
+
+    @property
+    def raw(self):
+        """The bytes of this URL."""
+        return self.match.group()
+
+    @property
+    def url(self):
+        """This URL, decoded into a new :class:`~urlobject.URLObject`."""
+        return self.dump.url_class(self.raw.decode(self.dump.encoding))
+
+    def __component(self, component):
+        value = self.match.group(COMPONENT_GROUPS[component])
+        if value is None:
+            return ''
+        return value.decode(self.dump.encoding)
+
+    @property
+    def scheme(self):
+        return self.__component('scheme').lower()
+
+    @property
+    def netloc(self):
+        return Netloc(self.__component('netloc'))
+
+    @property
+    def hostname(self):
+        return self.netloc.hostname
+
+    @property
+    def path(self):
+        return URLPath(self.__component('path'))
+
+    @property
+    def query(self):
+        return QueryString(self.__component('query'))
+
+    @property
+    def fragment(self):
+        return path_decode(self.__component('fragment'))
+
+    def hostname_span(self):
+        """The offsets of the hostname within the netloc, or ``None``."""
+        netloc = self.span('netloc')
+        if netloc is None:
+            return None
+        buf = self.dump.buffer
+        start, end = netloc
+        at = buf.rfind(b'@', start, end)
+        if at >= 0:
+            start = at + 1
+        if buf[start:start + 1] == b'[':
+            start += 1
+            close = buf.find(b']', start, end)
+            return start, (end if close < 0 else close)
+        colon = buf.find(b':', start, end)
+        return start, (end if colon < 0 else colon)
+
+    def has_hostname(self, hostname):
+        """Does this URL have the given (lowercase, encoded) hostname?"""
+        span = self.hostname_span()
+        if span is None or span[1] - span[0] != len(hostname):
+            return False
+        return self.dump.buffer[span[0]:span[1]].lower() == hostname
+
+    def has_path_prefix(self, prefix):
+        """Does the raw path of this URL start with the given bytes?"""
+        start, end = self.match.span(COMPONENT_GROUPS['path'])
+        if end - start < len(prefix):
+            return False
+        return self.dump.buffer.find(prefix, start, start + len(prefix)) == start
+
+    def has_prefix(self, prefix):
+        """Does this URL start with the given bytes?"""
+        start, end = self.match.span()
+        if end - start < len(prefix):
+            return False
+        return self.dump.buffer.find(prefix, start, start + len(prefix)) == start
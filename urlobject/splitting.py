@@ -0,0 +1,31 @@
+"""
+Split URLs into their components with the regex from RFC 3986, Appendix B.
+
+Unlike ``urlsplit()``, this tells a missing component (``None``) from an
+empty one (``''``):
+
+    >>> SPLIT_URL.match('http://a/b?c#d').groups()
+    ('http', 'a', '/b', 'c', 'd')
+    >>> SPLIT_URL.match('b?#').groups()
+    (None, None, 'b', '', '')
+    >>> SPLIT_URL_BYTES.match(b'//a').groups()
+    (None, b'a', b'', None, None)
+"""
+
+import re
+
+
+#: The Appendix B pattern, with the delimiters left out of the groups, and
+#: only letters, digits, ``+``, ``.`` and ``-`` allowed in a scheme.
+PATTERN = (r'(?:([A-Za-z][A-Za-z0-9+.\-]*):)?'
+           r'(?://([^/?#]*))?'
+           r'([^?#]*)'
+           r'(?:\?([^#]*))?'
+           r'(?:#(.*))?')
+
+#: Splits a URL into ``(scheme, netloc, path, query, fragment)``. It always
+#: matches the whole string.
+SPLIT_URL = re.compile(PATTERN, re.DOTALL)
+
+#: :data:`SPLIT_URL` for bytes.
+SPLIT_URL_BYTES = re.compile(PATTERN.encode('ascii'), re.DOTALL)
@@ -0,0 +1,99 @@
+"""Read and write newline-delimited URL files without loading them whole."""
+
+import bz2
+import gzip
+import io
+import itertools
+import lzma
+
+from .urlobject import URLObject
+
+
+#: Leading bytes of the compressed formats :func:`iter_urls` unpacks.
+COMPRESSED_FORMATS = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+    (b'\xfd7zXZ\x00', lzma.open),
+)
+
+
+def iter_urls(fileobj, iri=False, encoding='utf-8', on_error=None,
+              url_class=URLObject):
+    """
+    Lazily read URLs, one per line, from a file.
+
+    ``fileobj`` may be opened in text or binary mode. Binary streams which
+    are gzip, bzip2 or xz compressed are unpacked on the fly, and their lines
+    are decoded using ``encoding``. Surrounding whitespace and blank lines are
+    skipped. Only one line is held in memory at a time.
+
+    Each line becomes a ``url_class`` instance, created with
+    :meth:`~urlobject.URLObject.from_iri` if ``iri`` is true. Lines which
+    can't be decoded, encoded or parsed (e.g. with a bad port number) are not
+    yielded; instead, if given, ``on_error(line_number, line, exception)`` is
+    called, and reading carries on.
+
+    >>> lines = io.BytesIO(b'http://www.google.com/\\nhttp://github.com:x/\\n')
+    >>> for url in iter_urls(lines, on_error=lambda *error: print(error[:2])):
+    ...     print(url)
+    http://www.google.com/
+    (2, b'http://github.com:x/')
+    """
+    if isinstance(fileobj.read(0), bytes):
+        fileobj = decompressed(fileobj)
+        decode = lambda line: line.decode(encoding)
+    else:
+        decode = lambda line: line
+    parse = url_class.from_iri if iri else url_class
+
+    for line_number, line in enumerate(fileobj, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            url = parse(decode(line))
+            # Parse the URL (and check its port) now, so bad lines are caught.
+            url.port
+        except (UnicodeError, ValueError) as exc:
+            if on_error is not None:
+                on_error(line_number, line, exc)
+            continue
+        yield url
+
+
+def decompressed(fileobj):
+    """Wrap a binary stream to unpack it, if it is compressed."""
+    if not hasattr(fileobj, 'peek'):
+        fileobj = io.BufferedReader(fileobj)
+    header = fileobj.peek(6)
+    for magic, open_compressed in COMPRESSED_FORMATS:
+        if header.startswith(magic):
+            return open_compressed(fileobj)
+    return fileobj
+
+
+def write_urls(fileobj, urls, encoding='utf-8', buffer_lines=1000):
+    """
+    Write URLs to a file, one per line, returning how many were written.
+
+    The lines are gathered into blocks of ``buffer_lines`` and written with
+    one call each. Binary files (including those from :func:`gzip.open` and
+    friends) get the text encoded with ``encoding``.
+
+    >>> out = io.StringIO()
+    >>> write_urls(out, [URLObject('http://www.google.com/'), 'http://github.com/'])
+    2
+    >>> print(out.getvalue(), end='')
+    http://www.google.com/
+    http://github.com/
+    """
+    binary = isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase))
+    urls = iter(urls)
+    count = 0
+    while True:
+        block = list(itertools.islice(urls, buffer_lines))
+        if not block:
+            return count
+        data = '\n'.join(block) + '\n'
+        fileobj.write(data.encode(encoding) if binary else data)
+        count += len(block)
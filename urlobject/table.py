@@ -0,0 +1,249 @@
+"""Store large numbers of URLs compactly, column by column."""
+
+import array
+
+from .netloc import Netloc
+from .splitting import SPLIT_URL
+from .urlobject import URLObject
+
+
+# Flags recording which delimiters a URL has, so it can be rebuilt exactly.
+HAS_SCHEME, HAS_NETLOC, HAS_QUERY, HAS_FRAGMENT = 1, 2, 4, 8
+
+
+class Dictionary(object):
+
+    """A column of repetitive strings (or ``None``), stored as integer codes."""
+
+    def __init__(self):
+        self.values = [None]
+        self.codes_by_value = {None: 0}
+        self.codes = array.array('I')
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def code(self, value):
+        try:
+            return self.codes_by_value[value]
+        except KeyError:
+            code = self.codes_by_value[value] = len(self.values)
+            self.values.append(value)
+            return code
+
+    def append(self, value):
+        self.codes.append(self.code(value))
+
+    def matching_codes(self, predicate):
+        return frozenset(code for code, value in enumerate(self.values)
+                         if value is not None and predicate(value))
+
+    @property
+    def nbytes(self):
+        return (self.codes.itemsize * len(self.codes) +
+                sum(len(value) for value in self.values if value is not None))
+
+
+class TextColumn(object):
+
+    """A column of strings, stored end to end in one UTF-8 buffer."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array.array('Q', [0])
+
+    def __getitem__(self, row):
+        return self.data[self.offsets[row]:self.offsets[row + 1]].decode('utf-8')
+
+    def append(self, value):
+        self.data += value.encode('utf-8')
+        self.offsets.append(len(self.data))
+
+    def startswith(self, row, prefix):
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return (end - start >= len(prefix) and
+                self.data.startswith(prefix, start, end))
+
+    @property
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class URLTable(object):
+
+    """
+    A compact, append-only table of URLs.
+
+    Rather than keeping a :class:`~urlobject.URLObject` per URL, the table
+    splits each URL once and stores it in columns: the scheme, netloc and
+    hostname are dictionary-encoded (each distinct value is stored once, and
+    rows hold small integer codes), the port is kept in an array, and the
+    paths, queries and fragments are packed into byte buffers with an array
+    of offsets. That is a few dozen bytes per URL plus its path and query.
+
+    Indexing a table rebuilds the URL exactly as it was added, as a
+    ``url_class`` instance:
+
+    >>> table = URLTable(['https://github.com/zacharyvoase/urlobject?a=b',
+    ...                   'http://www.google.com/search?q=urlobject#top',
+    ...                   'https://gist.github.com/zacharyvoase'])
+    >>> len(table), table[1]
+    (3, URLObject('http://www.google.com/search?q=urlobject#top'))
+
+    The ``where_*`` methods filter rows without rebuilding any URLs, and
+    return a list of row numbers. Pass that as ``rows`` to narrow it down
+    further, or to :meth:`take` to get a new table:
+
+    >>> rows = table.where_host('github.com', subdomains=True)
+    >>> rows = table.where_path_prefix('/zacharyvoase', rows)
+    >>> rows
+    [0, 2]
+    >>> table.take(rows)[-1]
+    URLObject('https://gist.github.com/zacharyvoase')
+    """
+
+    def __init__(self, urls=(), url_class=URLObject):
+        self.url_class = url_class
+        self.schemes = Dictionary()
+        self.netlocs = Dictionary()
+        self.hosts = Dictionary()
+        self.ports = array.array('i')
+        self.paths = TextColumn()
+        self.queries = TextColumn()
+        self.fragments = TextColumn()
+        self.flags = bytearray()
+        self.extend(urls)
+
+    def __len__(self):
+        return len(self.flags)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return self.take(range(*row.indices(len(self))))
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("URLTable index out of range")
+        return self.url_class(self.raw(row))
+
+    def raw(self, row):
+        """The URL in a given row, as a plain string."""
+        flags = self.flags[row]
+        parts = []
+        if flags & HAS_SCHEME:
+            parts.append(self.schemes[row] + ':')
+        if flags & HAS_NETLOC:
+            parts.append('//' + self.netlocs[row])
+        parts.append(self.paths[row])
+        if flags & HAS_QUERY:
+            parts.append('?' + self.queries[row])
+        if flags & HAS_FRAGMENT:
+            parts.append('#' + self.fragments[row])
+        return ''.join(parts)
+
+    def append(self, url):
+        """
+        Add a URL (a string or :class:`~urlobject.URLObject`) to the table.
+
+        Like :attr:`URLObject.port <urlobject.URLObject.port>`, this raises
+        :class:`ValueError` if the URL has an invalid port.
+        """
+        scheme, netloc, path, query, fragment = SPLIT_URL.match(url).groups()
+        if netloc is None:
+            hostname, port = None, None
+        else:
+            netloc_object = Netloc(netloc)
+            hostname, port = netloc_object.hostname, netloc_object.port
+        flags = ((scheme is not None and HAS_SCHEME) |
+                 (netloc is not None and HAS_NETLOC) |
+                 (query is not None and HAS_QUERY) |
+                 (fragment is not None and HAS_FRAGMENT))
+        self.__append_row(flags, scheme, netloc, hostname, port, path,
+                          query or '', fragment or '')
+
+    def extend(self, urls):
+        """Add every URL in an iterable to the table."""
+        for url in urls:
+            self.append(url)
+
+    def __append_row(self, flags, scheme, netloc, hostname, port, path, query,
+                     fragment):
+        self.flags.append(flags)
+        self.schemes.append(scheme)
+        self.netlocs.append(netloc)
+        self.hosts.append(hostname)
+        self.ports.append(-1 if port is None else port)
+        self.paths.append(path)
+        self.queries.append(query)
+        self.fragments.append(fragment)
+
+    def take(self, rows):
+        """A new table with just the given rows, in the given order."""
+        table = type(self)(url_class=self.url_class)
+        for row in rows:
+            port = self.ports[row]
+            table.__append_row(self.flags[row], self.schemes[row],
+                               self.netlocs[row], self.hosts[row],
+                               None if port < 0 else port, self.paths[row],
+                               self.queries[row], self.fragments[row])
+        return table
+
+    def hostname(self, row):
+        """The hostname in a given row, or ``None``."""
+        return self.hosts[row]
+
+    def port(self, row):
+        """The port number in a given row, or ``None``."""
+        port = self.ports[row]
+        return None if port < 0 else port
+
+    def __rows(self, rows):
+        return range(len(self)) if rows is None else rows
+
+    def where_scheme(self, scheme, rows=None):
+        """The rows with a given scheme (compared case-insensitively)."""
+        scheme = scheme.lower()
+        codes = self.schemes.matching_codes(lambda value: value.lower() == scheme)
+        column = self.schemes.codes
+        return [row for row in self.__rows(rows) if column[row] in codes]
+
+    def where_host(self, hostname, rows=None, subdomains=False):
+        """
+        The rows with a given hostname (compared case-insensitively).
+
+        With ``subdomains``, hostnames ending in ``'.' + hostname`` match too.
+        """
+        hostname = hostname.lower()
+        if subdomains:
+            suffix = '.' + hostname
+            codes = self.hosts.matching_codes(
+                lambda value: value == hostname or value.endswith(suffix))
+        else:
+            codes = self.hosts.matching_codes(lambda value: value == hostname)
+        column = self.hosts.codes
+        return [row for row in self.__rows(rows) if column[row] in codes]
+
+    def where_port(self, port, rows=None):
+        """The rows with a given explicit port number (``None`` for none)."""
+        if port is None:
+            port = -1
+        column = self.ports
+        return [row for row in self.__rows(rows) if column[row] == port]
+
+    def where_path_prefix(self, prefix, rows=None):
+        """The rows whose raw path starts with ``prefix`` (give it encoded)."""
+        prefix = prefix.encode('utf-8')
+        startswith = self.paths.startswith
+        return [row for row in self.__rows(rows) if startswith(row, prefix)]
+
+    @property
+    def nbytes(self):
+        """Roughly how many bytes of memory the table's contents take up."""
+        return (len(self.flags) + self.ports.itemsize * len(self.ports) +
+                sum(column.nbytes for column in
+                    (self.schemes, self.netlocs, self.hosts, self.paths,
+                     self.queries, self.fragments)))
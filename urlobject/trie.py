@@ -0,0 +1,269 @@
+"""Tries for matching URLs by hostname suffix or path prefix."""
+
+from .path import URLPath, path_decode
+from .urlobject import URLObject
+
+
+#: The key for wildcard segments in a :class:`PathTrie`.
+WILDCARD = object()
+
+
+class Node(object):
+
+    """A node in a trie: its children by key, and the items stored at it."""
+
+    __slots__ = ('children', 'items')
+
+    def __init__(self):
+        self.children = {}
+        self.items = []
+
+    def walk(self):
+        """Yield every item at or below this node, depth first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for item in node.items:
+                yield item
+            stack.extend(reversed(list(node.children.values())))
+
+
+def host_labels(hostname):
+    """The labels of a hostname, from the top-level domain down."""
+    labels = hostname.lower().rstrip('.').split('.')
+    labels.reverse()
+    return labels
+
+
+class HostIndex(object):
+
+    """
+    An index of URLs (or other items) by hostname, for suffix matching.
+
+    Hostnames are stored in a trie of their labels, from the top-level domain
+    down, so every lookup takes time proportional to the number of labels in
+    the hostname, however many are in the index. Hostnames are compared
+    case-insensitively.
+
+    Add :class:`~urlobject.URLObject` instances to index them by their
+    :attr:`~urlobject.URLObject.hostname`, then find the ones on a domain or
+    any of its subdomains:
+
+    >>> index = HostIndex()
+    >>> for url in ['https://github.com/zacharyvoase', 'https://gist.github.com/',
+    ...             'http://www.google.com/', 'http://notgithub.com/']:
+    ...     index.add(URLObject(url))
+    >>> for url in index.under('github.com'):
+    ...     print(url)
+    https://github.com/zacharyvoase
+    https://gist.github.com/
+
+    Or add rules, as hostnames with a value, and find which ones cover a host,
+    e.g. for allow and deny lists:
+
+    >>> rules = HostIndex()
+    >>> rules.add('example.com', 'allow')
+    >>> rules.add('ads.example.com', 'deny')
+    >>> rules.longest_match('tracker.ads.EXAMPLE.com')
+    ('ads.example.com', ['deny'])
+    >>> rules.matches('www.example.com')
+    [('example.com', ['allow'])]
+    >>> print(rules.longest_match('example.org'))
+    None
+    """
+
+    def __init__(self, items=()):
+        self.root = Node()
+        self.size = 0
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return self.root.walk()
+
+    def add(self, key, item=None):
+        """
+        Add an item under a hostname.
+
+        ``key`` is a hostname, or a :class:`~urlobject.URLObject` whose
+        hostname is used; in that case ``item`` defaults to the URL itself.
+        """
+        if isinstance(key, URLObject):
+            if item is None:
+                item = key
+            key = key.hostname
+            if key is None:
+                raise ValueError("Can't index a URL with no hostname")
+        node = self.root
+        for label in host_labels(key):
+            child = node.children.get(label)
+            if child is None:
+                child = node.children[label] = Node()
+            node = child
+        node.items.append(item)
+        self.size += 1
+
+    def extend(self, keys):
+        """Add each URL (or hostname) in an iterable."""
+        for key in keys:
+            self.add(key)
+
+    def __find(self, hostname):
+        node = self.root
+        for label in host_labels(hostname):
+            node = node.children.get(label)
+            if node is None:
+                return None
+        return node
+
+    def get(self, hostname):
+        """The items added under exactly this hostname."""
+        node = self.__find(hostname)
+        return [] if node is None else list(node.items)
+
+    def under(self, domain):
+        """Yield the items under ``domain``, or any of its subdomains."""
+        node = self.__find(domain)
+        if node is None:
+            return iter(())
+        return node.walk()
+
+    def matches(self, hostname):
+        """
+        Every ``(domain, items)`` pair which covers ``hostname``.
+
+        That is, each hostname in the index which is ``hostname`` itself or
+        one of its parent domains, shortest first.
+        """
+        labels = host_labels(hostname)
+        result = []
+        node = self.root
+        for depth, label in enumerate(labels, 1):
+            node = node.children.get(label)
+            if node is None:
+                break
+            if node.items:
+                result.append(('.'.join(reversed(labels[:depth])),
+                               list(node.items)))
+        return result
+
+    def longest_match(self, hostname):
+        """
+        The most specific ``(domain, items)`` pair covering ``hostname``.
+
+        Returns ``None`` if nothing in the index covers it.
+        """
+        matches = self.matches(hostname)
+        return matches[-1] if matches else None
+
+
+def path_segments(path):
+    """The decoded segments of a path, without any trailing empty segment."""
+    if isinstance(path, URLObject):
+        path = path.path
+    segments = list(URLPath(path).segments)
+    if segments and segments[-1] == '':
+        segments.pop()
+    return segments
+
+
+class PathTrie(object):
+
+    """
+    A router from path prefixes to values, using a trie of path segments.
+
+    Paths are split into decoded segments (as by :attr:`URLPath.segments
+    <urlobject.path.URLPath.segments>`), so ``/a%20b`` and ``/a b`` are the
+    same, and prefixes only match whole segments: ``/api`` covers ``/api``,
+    ``/api/`` and ``/api/v2``, but not ``/apis``. A ``*`` segment in a prefix
+    matches any one segment. Lookups follow one path through the trie per
+    wildcard branch, so they take time proportional to the depth of the path
+    rather than the number of prefixes.
+
+    >>> routes = PathTrie()
+    >>> routes.add('/', 'root')
+    >>> routes.add('/api/', 'api')
+    >>> routes.add('/api/*/users', 'users')
+    >>> routes.add('/api/v2/users', 'v2 users')
+    >>> routes.longest_match('/api/v2/users/123')
+    ('/api/v2/users', 'v2 users')
+    >>> routes.longest_match(URLObject('http://example.com/api/v1/users?page=2'))
+    ('/api/*/users', 'users')
+    >>> routes.longest_match('/static/logo.png')
+    ('/', 'root')
+    >>> print(routes.get('/api/v1'))
+    None
+    """
+
+    def __init__(self, routes=()):
+        self.root = Node()
+        self.size = 0
+        for prefix, value in routes:
+            self.add(prefix, value)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, prefix, value):
+        """Map ``prefix`` to ``value``, replacing any previous value."""
+        if isinstance(prefix, URLObject):
+            prefix = prefix.path
+        raw_segments = prefix.split('/')
+        if raw_segments[0] == '':
+            raw_segments.pop(0)
+        if raw_segments and raw_segments[-1] == '':
+            raw_segments.pop()
+        node = self.root
+        for raw_segment in raw_segments:
+            key = WILDCARD if raw_segment == '*' else path_decode(raw_segment)
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = Node()
+            node = child
+        if not node.items:
+            self.size += 1
+        node.items[:] = [(prefix, value)]
+
+    def __match(self, segments):
+        """The nodes with values covering ``segments``, least specific first."""
+        found = []
+        # Each entry is (node, depth, number of literal segments matched).
+        stack = [(self.root, 0, 0)]
+        while stack:
+            node, depth, literals = stack.pop()
+            if node.items:
+                found.append((depth, literals, node))
+            if depth < len(segments):
+                child = node.children.get(WILDCARD)
+                if child is not None:
+                    stack.append((child, depth + 1, literals))
+                child = node.children.get(segments[depth])
+                if child is not None:
+                    stack.append((child, depth + 1, literals + 1))
+        found.sort(key=lambda match: match[:2])
+        return found
+
+    def matches(self, path):
+        """Every ``(prefix, value)`` pair covering ``path``, shortest first."""
+        return [node.items[0] for _, _, node in self.__match(path_segments(path))]
+
+    def longest_match(self, path):
+        """
+        The most specific ``(prefix, value)`` pair covering ``path``.
+
+        Longer prefixes win; between prefixes of the same length, the one with
+        fewer wildcards wins. Returns ``None`` if nothing covers ``path``.
+        """
+        found = self.__match(path_segments(path))
+        return found[-1][2].items[0] if found else None
+
+    def get(self, path, default=None):
+        """The value for a prefix matching all of ``path``, or ``default``."""
+        segments = path_segments(path)
+        found = self.__match(segments)
+        if found and found[-1][0] == len(segments):
+            return found[-1][2].items[0][1]
+        return default